@@ -1,19 +1,70 @@
-from flask import Flask, render_template, request, jsonify, redirect, session, url_for
 import os
-from functools import wraps
+
+# gevent workers need the stdlib patched before anything imports sockets;
+# harmless no-op when gevent is not installed (e.g. local dev server).
+# psycopg2's C-level sockets are invisible to monkey.patch_all, so the
+# database backend additionally needs psycogreen - without it one query
+# would block the whole event loop, and gunicorn_config falls back to
+# gthread workers instead. Mirror that choice here: only patch when the
+# gevent worker class will actually be used.
+try:
+    from gevent import monkey
+    if os.getenv('DATABASE_URL'):
+        from psycogreen.gevent import patch_psycopg
+        monkey.patch_all()
+        patch_psycopg()
+    else:
+        monkey.patch_all()
+except ImportError:
+    pass
+
+from flask import Flask, render_template, request, jsonify, redirect, session, url_for, g
+from flask.json.provider import DefaultJSONProvider
+import hashlib
+import re
+import socket
+import time
+import secrets
+import traceback
+import uuid
+from collections import Counter, defaultdict
+from functools import lru_cache, wraps
 from datetime import datetime
 from anthropic import Anthropic
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import storage layer - automatically uses JSON or PostgreSQL based on DATABASE_URL
 from storage import (
     load_votes, save_votes, save_vote,
     load_config, save_config,
     load_roles, save_roles, save_role,
     get_role_by_id, delete_role as delete_role_storage,
-    init_db, USE_DATABASE
+    get_role_with_voted_ids,
+    init_db, USE_DATABASE, data_version, aggregate_votes, count_votes,
+    distinct_voted_candidate_ids, vote_counts_by_role, role_has_votes
 )
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson - keeps jsonify() call sites unchanged
+    while cutting response serialization cost. Only installed when orjson is
+    available; otherwise Flask's stdlib-based default provider stays."""
+
+    def dumps(self, obj, **kwargs):
+        # default=str covers the odd UUID/datetime that reaches jsonify
+        # un-stringified, matching how the stdlib provider coerces them
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-prod')
 ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'admin')
 
@@ -25,6 +76,101 @@ if os.environ.get('ANTHROPIC_API_KEY'):
 # Detect if running in production (Render sets PORT environment variable)
 IS_PRODUCTION = 'RENDER' in os.environ or os.environ.get('PORT') == '10000'
 
+# Claude summary cache: identical notes are resubmitted from preview/edit
+# flows, and every call costs seconds plus API credits. Keys are content
+# hashes, so aggregate summaries are reused only while the underlying votes
+# are unchanged. Uses Redis when REDIS_URL is set (shared across workers),
+# otherwise a bounded in-process dict.
+_SUMMARY_CACHE_TTL = 86400  # seconds
+_summary_cache = {}  # key -> (expires_at, summary); in-process fallback
+_summary_redis = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis
+        _summary_redis = redis.Redis.from_url(os.environ['REDIS_URL'])
+    except ImportError:
+        pass
+
+def _summary_cache_get(key):
+    """Return a cached summary or None (cache errors read as misses)"""
+    if _summary_redis is not None:
+        try:
+            cached = _summary_redis.get(key)
+        except Exception:
+            return None
+        return cached.decode() if cached is not None else None
+    entry = _summary_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _summary_cache_set(key, summary):
+    """Store a summary for _SUMMARY_CACHE_TTL seconds"""
+    if _summary_redis is not None:
+        try:
+            _summary_redis.setex(key, _SUMMARY_CACHE_TTL, summary)
+        except Exception:
+            pass
+        return
+    if len(_summary_cache) > 256:
+        now = time.monotonic()
+        for stale_key in [k for k, v in _summary_cache.items() if v[0] <= now]:
+            del _summary_cache[stale_key]
+        if len(_summary_cache) > 256:
+            _summary_cache.clear()
+    _summary_cache[key] = (time.monotonic() + _SUMMARY_CACHE_TTL, summary)
+
+def _uuid7():
+    """Time-ordered UUID (RFC 9562 version 7) for new role ids.
+
+    Time-prefixed keys index and sort better than random uuid4 as roles
+    accumulate. Mirrors models.uuid7 - the storage layer keeps app.py free
+    of SQLAlchemy imports, so the two can't share a definition.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    return uuid.UUID(int=(
+        (ts_ms << 80)
+        | (0x7 << 76)
+        | ((rand >> 62) << 64)
+        | (0x2 << 62)
+        | (rand & ((1 << 62) - 1))
+    ))
+
+
+# Compiled once at import time - matches one non-space local part, an @, and
+# a domain containing at least one dot
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Serialized-response caches for the poll-heavy read endpoints, keyed on the
+# storage layer's data_version token (JSON backend only - the token is None
+# on the database backend and these are skipped)
+_results_cache = {'key': None, 'body': None}
+_status_cache = {'key': None, 'body': None}
+
+def _cached_response(cache):
+    """Return the cached response body if the data files are unchanged"""
+    version = data_version()
+    if version is not None and cache['key'] == version:
+        return version, app.response_class(cache['body'], mimetype='application/json')
+    return version, None
+
+def _store_response(cache, version, response):
+    """Remember the serialized body for as long as the data files stay put"""
+    if version is not None and response.status_code == 200:
+        cache['key'] = version
+        cache['body'] = response.get_data()
+    return response
+
+# Page shells that render identically on every request (their templates take
+# no context) - rendered once per process and browser-cacheable
+_STATIC_PAGES = frozenset({'/', '/vote', '/results', '/admin'})
+
+@lru_cache(maxsize=None)
+def _render_page(template_name):
+    """Render-once cache for the static page shells"""
+    return render_template(template_name)
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -68,11 +214,25 @@ if USE_DATABASE:
         print(f"✗ Database initialization failed: {e}")
         raise
 
+# Paths exempt from the HTTPS redirect check: static assets and health
+# probes don't need it and are hit constantly
+_SKIP_HTTPS_PREFIXES = ('/static/', '/healthz')
+
+# Built once - headers.update against a shared dict instead of rebuilding
+# the literal per response
+_SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'SAMEORIGIN',
+    'X-XSS-Protection': '1; mode=block',
+}
+if IS_PRODUCTION:
+    _SECURITY_HEADERS['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+
 # Force HTTPS in production
 @app.before_request
 def before_request():
     """Redirect HTTP to HTTPS in production"""
-    if IS_PRODUCTION:
+    if IS_PRODUCTION and not request.path.startswith(_SKIP_HTTPS_PREFIXES):
         # Check if request was made over HTTP (via X-Forwarded-Proto header from proxy)
         if request.headers.get('X-Forwarded-Proto', 'http') != 'https':
             url = request.url.replace('http://', 'https://', 1)
@@ -81,12 +241,26 @@ def before_request():
 @app.after_request
 def add_security_headers(response):
     """Add security headers to all responses"""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'SAMEORIGIN'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    # Add HSTS header in production
-    if IS_PRODUCTION:
-        response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+    response.headers.update(_SECURITY_HEADERS)
+    # Let browsers cache the static page shells briefly - all live data on
+    # these pages is fetched from /api/* endpoints
+    if request.path in _STATIC_PAGES and response.status_code == 200:
+        response.cache_control.max_age = 300
+    return response
+
+@app.after_request
+def add_etag(response):
+    """Give GET JSON responses an ETag and honor If-None-Match.
+
+    The vote and results pages poll /api/status, /api/results and the
+    progress endpoints; between votes those payloads are identical, so
+    matching clients get an empty 304 instead of the full body.
+    """
+    if (request.method == 'GET' and response.status_code == 200
+            and response.mimetype == 'application/json'
+            and not response.direct_passthrough):
+        response.add_etag()
+        return response.make_conditional(request)
     return response
 
 # Global error handlers to return JSON instead of HTML for API endpoints
@@ -95,7 +269,7 @@ def not_found_error(error):
     """Handle 404 errors - return JSON for API endpoints, HTML for pages"""
     if request.path.startswith('/api/'):
         return jsonify({'success': False, 'message': 'Endpoint not found'}), 404
-    return render_template('vote.html'), 404  # Redirect to voting page for non-API 404s
+    return _render_page('vote.html'), 404  # Redirect to voting page for non-API 404s
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -107,7 +281,6 @@ def internal_error(error):
 @app.errorhandler(Exception)
 def handle_exception(error):
     """Global exception handler - return JSON for API endpoints"""
-    import traceback
     error_details = str(error)
 
     # Log the full traceback for debugging
@@ -116,10 +289,11 @@ def handle_exception(error):
 
     # Return JSON for API endpoints
     if request.path.startswith('/api/'):
-        # Check for common database errors
-        if 'UUID' in error_details or 'uuid' in error_details.lower():
+        # Check for common database errors (lowercase once, not per check)
+        details_lower = error_details.lower()
+        if 'uuid' in details_lower:
             return jsonify({'success': False, 'message': 'Invalid ID format. Please try again or refresh the page.'}), 400
-        elif 'database' in error_details.lower() or 'connection' in error_details.lower():
+        elif 'database' in details_lower or 'connection' in details_lower:
             return jsonify({'success': False, 'message': 'Database connection error. Please try again in a moment.'}), 500
         else:
             return jsonify({'success': False, 'message': f'An error occurred: {error_details}'}), 500
@@ -143,8 +317,7 @@ def migrate_config_to_roles():
         return
 
     # Create first role from existing config
-    import uuid
-    role_id = str(uuid.uuid4())
+    role_id = str(_uuid7())
 
     role = {
         'id': role_id,
@@ -165,53 +338,219 @@ def migrate_config_to_roles():
             vote['role_id'] = role_id
     save_votes(votes_data)
 
-def get_total_voters():
+def _now_iso():
+    """Timestamp for records written in this request, formatted once on g.
+
+    Votes submitted together in one request share a timestamp anyway, so
+    the datetime allocation and isoformat string build happen at most once.
+    """
+    if 'now_iso' not in g:
+        g.now_iso = datetime.now().isoformat()
+    return g.now_iso
+
+def _cached_config():
+    """Load the legacy config at most once per request (stashed on flask.g)"""
+    if 'config' not in g:
+        g.config = load_config()
+    return g.config
+
+def _cached_votes():
+    """Load votes at most once per request (stashed on flask.g)"""
+    if 'votes_data' not in g:
+        g.votes_data = load_votes()
+    return g.votes_data
+
+def _cached_roles():
+    """Load roles at most once per request (stashed on flask.g)"""
+    if 'roles_data' not in g:
+        g.roles_data = load_roles()
+    return g.roles_data
+
+# Process-level role cache: role definitions change rarely but are read on
+# every vote, progress and results request. Entries are keyed by a version
+# counter that every role write bumps, so a write in this process can never
+# be masked by an older cached entry; the TTL bounds staleness across
+# workers. On a storage failure the last known good role is served so reads
+# survive a transient database blip.
+_ROLE_CACHE_TTL = 15  # seconds
+_role_cache = {}       # (role_id, version) -> (expires_at, role)
+_role_cache_version = 0
+_role_last_good = {}   # role_id -> last successfully loaded role
+
+def _cached_role(role_id):
+    """get_role_by_id with a short TTL cache and stale-on-error fallback"""
+    key = (role_id, _role_cache_version)
+    now = time.monotonic()
+    entry = _role_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    try:
+        role = get_role_by_id(role_id)
+    except Exception:
+        stale = _role_last_good.get(role_id)
+        if stale is not None:
+            return stale
+        raise
+
+    if len(_role_cache) > 64:
+        for stale_key in [k for k, v in _role_cache.items() if v[0] <= now]:
+            del _role_cache[stale_key]
+    _role_cache[key] = (now + _ROLE_CACHE_TTL, role)
+    if role is not None:
+        _role_last_good[role_id] = role
+    return role
+
+def _invalidate_cached_roles():
+    """Drop role caches after a role write (request-scoped and process-level)"""
+    global _role_cache_version
+    g.pop('roles_data', None)
+    _role_cache_version += 1
+    _role_cache.clear()
+
+def _allowed_email_set(config):
+    """Normalized allowed-email set, cached on the loaded config dict.
+
+    Prefers the precomputed allowed_emails_norm list persisted by
+    save_configuration; falls back to normalizing on the fly for configs
+    saved before that key existed.
+    """
+    allowed = config.get('_allowed_set')
+    if allowed is None:
+        emails = config.get('allowed_emails_norm')
+        if emails is None:
+            emails = [email.strip().lower() for email in config.get('allowed_emails', []) if email.strip()]
+        allowed = frozenset(emails)
+        config['_allowed_set'] = allowed
+    return allowed
+
+def _role_allowed_set(role):
+    """Normalized allowed-email set for a role, cached on the role dict.
+
+    Role dicts are reused by the TTL cache, so the set is computed once per
+    cached role instead of once per vote request.
+    """
+    allowed = role.get('_allowed_set')
+    if allowed is None:
+        allowed = frozenset(email.strip().lower() for email in role.get('allowed_emails', []) if email.strip())
+        role['_allowed_set'] = allowed
+    return allowed
+
+def _role_candidates_by_id(role):
+    """Candidate lookup dict for a role, cached on the role dict"""
+    by_id = role.get('_cand_by_id')
+    if by_id is None:
+        by_id = {c['id']: c for c in role.get('candidates', [])}
+        role['_cand_by_id'] = by_id
+    return by_id
+
+def _public_role(role, **extra):
+    """Copy of a role dict with the underscore-prefixed derived caches
+    stripped - they ride on the storage-shared dicts for reuse between
+    requests, but they are not part of the role and some (frozensets)
+    do not even serialize. Every role that reaches a response body or a
+    save payload goes through here.
+    """
+    public = {k: v for k, v in role.items() if not k.startswith('_')}
+    public.update(extra)
+    return public
+
+def _candidates_by_id(config):
+    """Candidate lookup dict, cached on the loaded config dict.
+
+    Rebuilt whenever the config file is re-read; never persisted.
+    """
+    by_id = config.get('_candidates_by_id')
+    if by_id is None:
+        by_id = {c['id']: c for c in config.get('candidates', [])}
+        config['_candidates_by_id'] = by_id
+    return by_id
+
+def _votes_index(votes_data):
+    """Per-voter vote index cached on the loaded votes dict.
+
+    Maps voter email -> {(candidate_id, role_id): position in the votes list}.
+    Legacy votes (no role) use a None role_id. The vote submission paths keep
+    the index current when they append; it is rebuilt from scratch whenever
+    the votes file is re-read from disk.
+    """
+    index = votes_data.get('_by_voter')
+    if index is None:
+        index = {}
+        # Voter emails are lowercased at write time, so no per-vote .lower()
+        for i, vote in enumerate(votes_data['votes']):
+            index.setdefault(vote['voter'], {})[(vote['candidate_id'], vote.get('role_id'))] = i
+        votes_data['_by_voter'] = index
+    return index
+
+def _candidate_tallies(votes_data):
+    """Per-candidate vote tallies, cached on the loaded votes dict.
+
+    A single pass builds {candidate_id: {'inclined': x, 'not_inclined': y,
+    'votes': [...]}} so results reads between writes are dict lookups
+    instead of one scan per candidate. Dropped on every vote write and
+    rebuilt lazily rather than persisted, so the tallies can never drift
+    from the vote list.
+    """
+    tallies = votes_data.get('_tallies')
+    if tallies is None:
+        tallies = {}
+        for vote in votes_data['votes']:
+            tally = tallies.get(vote['candidate_id'])
+            if tally is None:
+                tally = tallies[vote['candidate_id']] = {'inclined': 0, 'not_inclined': 0, 'votes': []}
+            if vote['choice'] == 'Inclined':
+                tally['inclined'] += 1
+            elif vote['choice'] == 'Not Inclined':
+                tally['not_inclined'] += 1
+            tally['votes'].append(vote)
+        votes_data['_tallies'] = tallies
+    return tallies
+
+def get_total_voters(config=None):
     """Get total number of voters from config"""
-    config = load_config()
+    if config is None:
+        config = _cached_config()
     if config['is_configured']:
         # Count non-empty emails
         return len([email for email in config['allowed_emails'] if email.strip()])
     return 0
 
-def get_total_candidates():
+def get_total_candidates(config=None):
     """Get total number of candidates from config"""
-    config = load_config()
+    if config is None:
+        config = _cached_config()
     return len(config.get('candidates', []))
 
 def get_voter_progress(voter_email):
     """Get which candidates a voter has voted on"""
-    votes_data = load_votes()
-    voted_candidate_ids = []
-    for vote in votes_data['votes']:
-        if vote['voter'].lower() == voter_email.lower():
-            voted_candidate_ids.append(vote['candidate_id'])
-    return voted_candidate_ids
+    votes_data = _cached_votes()
+    voter_votes = _votes_index(votes_data).get(voter_email.lower(), {})
+    return [candidate_id for candidate_id, _role_id in voter_votes]
 
 def is_voting_complete():
     """Check if all voters have voted on all candidates"""
-    config = load_config()
-    votes_data = load_votes()
+    config = _cached_config()
 
-    total_voters = get_total_voters()
-    total_candidates = get_total_candidates()
+    total_voters = get_total_voters(config)
+    total_candidates = get_total_candidates(config)
 
     if total_voters == 0 or total_candidates == 0:
         return False
 
-    expected_total_votes = total_voters * total_candidates
-    actual_total_votes = len(votes_data['votes'])
-
-    return actual_total_votes >= expected_total_votes
+    # Counts only - a SELECT count(*) on the database backend rather than
+    # loading every vote row
+    return count_votes() >= total_voters * total_candidates
 
 @app.route('/')
 def index():
     """Redirect to voting page"""
-    return render_template('vote.html')
+    return _render_page('vote.html')
 
 @app.route('/vote')
 def vote_page():
     """Display voting page"""
-    return render_template('vote.html')
+    return _render_page('vote.html')
 
 @app.route('/api/vote', methods=['POST'])
 def submit_vote():
@@ -225,7 +564,7 @@ def submit_vote():
 
     # If role_id is provided, use new multi-role system
     if role_id:
-        role = get_role_by_id(role_id)
+        role = _cached_role(role_id)
         if not role:
             return jsonify({'success': False, 'message': 'Role not found'}), 404
 
@@ -234,15 +573,14 @@ def submit_vote():
             return jsonify({'success': False, 'message': 'Please enter your email'}), 400
 
         # Check if email is in allowed list for this role
-        allowed_emails = [email.strip().lower() for email in role.get('allowed_emails', []) if email.strip()]
-        if voter_email not in allowed_emails:
+        if voter_email not in _role_allowed_set(role):
             return jsonify({'success': False, 'message': 'Your email is not authorized to vote for this role'}), 403
 
         # Validate candidate
         if not candidate_id:
             return jsonify({'success': False, 'message': 'Candidate ID is required'}), 400
 
-        candidate = next((c for c in role.get('candidates', []) if c['id'] == candidate_id), None)
+        candidate = _role_candidates_by_id(role).get(candidate_id)
         if not candidate:
             return jsonify({'success': False, 'message': 'Invalid candidate'}), 400
 
@@ -255,16 +593,11 @@ def submit_vote():
             return jsonify({'success': False, 'message': 'Feedback is required'}), 400
 
         # Load existing votes
-        votes_data = load_votes()
+        votes_data = _cached_votes()
 
         # Check if voter already voted for this candidate in this role - if so, update it
-        existing_vote_index = None
-        for i, vote in enumerate(votes_data['votes']):
-            if (vote['voter'].lower() == voter_email and
-                vote['candidate_id'] == candidate_id and
-                vote.get('role_id') == role_id):
-                existing_vote_index = i
-                break
+        index = _votes_index(votes_data)
+        existing_vote_index = index.get(voter_email, {}).get((candidate_id, role_id))
 
         vote_record = {
             'voter': voter_email,
@@ -274,23 +607,23 @@ def submit_vote():
             'role_position': role['position'],
             'choice': choice,
             'feedback': feedback,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
 
         if existing_vote_index is not None:
-            # Update existing vote
-            votes_data['votes'][existing_vote_index] = vote_record
             message = f'Vote updated for {candidate["name"]} ({role["position"]})!'
         else:
-            # Add new vote
-            votes_data['votes'].append(vote_record)
             message = f'Vote recorded for {candidate["name"]} ({role["position"]})!'
 
-        # Save votes
-        save_votes(votes_data)
+        # Single-record write: an append on the JSON backend, an upsert on
+        # the database backend - no whole-file rewrite per vote. Drop the
+        # request-scoped snapshot so the progress count below re-reads.
+        save_vote(vote_record)
+        g.pop('votes_data', None)
 
         # Count progress for this role
-        role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id and v['voter'].lower() == voter_email]
+        votes_data = _cached_votes()
+        role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id and v['voter'] == voter_email]
         total_candidates = len(role.get('candidates', []))
 
         return jsonify({
@@ -302,7 +635,7 @@ def submit_vote():
 
     # Legacy path: Use old config.json system if no role_id provided
     # Load configuration
-    config = load_config()
+    config = _cached_config()
 
     # Check if system is configured
     if not config['is_configured']:
@@ -313,15 +646,14 @@ def submit_vote():
         return jsonify({'success': False, 'message': 'Please enter your email'}), 400
 
     # Check if email is in allowed list
-    allowed_emails = [email.strip().lower() for email in config['allowed_emails'] if email.strip()]
-    if voter_email not in allowed_emails:
+    if voter_email not in _allowed_email_set(config):
         return jsonify({'success': False, 'message': 'Your email is not authorized to vote'}), 403
 
     # Validate candidate
     if not candidate_id:
         return jsonify({'success': False, 'message': 'Candidate ID is required'}), 400
 
-    candidate = next((c for c in config['candidates'] if c['id'] == candidate_id), None)
+    candidate = _candidates_by_id(config).get(candidate_id)
     if not candidate:
         return jsonify({'success': False, 'message': 'Invalid candidate'}), 400
 
@@ -334,14 +666,11 @@ def submit_vote():
         return jsonify({'success': False, 'message': 'Feedback is required'}), 400
 
     # Load existing votes
-    votes_data = load_votes()
+    votes_data = _cached_votes()
 
     # Check if voter already voted for this candidate - if so, update it
-    existing_vote_index = None
-    for i, vote in enumerate(votes_data['votes']):
-        if vote['voter'].lower() == voter_email and vote['candidate_id'] == candidate_id:
-            existing_vote_index = i
-            break
+    index = _votes_index(votes_data)
+    existing_vote_index = index.get(voter_email, {}).get((candidate_id, None))
 
     vote_record = {
         'voter': voter_email,
@@ -349,20 +678,19 @@ def submit_vote():
         'candidate_name': candidate['name'],
         'choice': choice,
         'feedback': feedback,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now_iso()
     }
 
     if existing_vote_index is not None:
-        # Update existing vote
-        votes_data['votes'][existing_vote_index] = vote_record
         message = f'Vote updated for {candidate["name"]}!'
     else:
-        # Add new vote
-        votes_data['votes'].append(vote_record)
         message = f'Vote recorded for {candidate["name"]}!'
 
-    # Save votes
-    save_votes(votes_data)
+    # Single-record write: an append on the JSON backend, an upsert on the
+    # database backend - no whole-file rewrite per vote. Drop the
+    # request-scoped snapshot so the progress check below re-reads.
+    save_vote(vote_record)
+    g.pop('votes_data', None)
 
     # Check progress
     voter_progress = get_voter_progress(voter_email)
@@ -384,21 +712,21 @@ def get_voter_progress_api():
     if not voter_email:
         return jsonify({'success': False, 'message': 'Email is required'}), 400
 
-    config = load_config()
-    votes_data = load_votes()
+    config = _cached_config()
+    votes_data = _cached_votes()
 
     # Get all candidates
     candidates = config.get('candidates', [])
 
     # Get voter's votes
     voter_votes = {}
-    for vote in votes_data['votes']:
-        if vote['voter'].lower() == voter_email:
-            voter_votes[vote['candidate_id']] = {
-                'choice': vote['choice'],
-                'feedback': vote['feedback'],
-                'timestamp': vote['timestamp']
-            }
+    for (vote_candidate_id, _role_id), i in _votes_index(votes_data).get(voter_email, {}).items():
+        vote = votes_data['votes'][i]
+        voter_votes[vote_candidate_id] = {
+            'choice': vote['choice'],
+            'feedback': vote['feedback'],
+            'timestamp': vote['timestamp']
+        }
 
     # Build response with candidate status
     candidate_status = []
@@ -431,11 +759,11 @@ def get_voter_role_progress_api():
     if not role_id:
         return jsonify({'success': False, 'message': 'Role ID is required'}), 400
 
-    role = get_role_by_id(role_id)
+    role = _cached_role(role_id)
     if not role:
         return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-    votes_data = load_votes()
+    votes_data = _cached_votes()
 
     # Get all candidates for this role
     candidates = role.get('candidates', [])
@@ -443,7 +771,7 @@ def get_voter_role_progress_api():
     # Get voter's votes for this role
     voter_votes = {}
     for vote in votes_data['votes']:
-        if vote['voter'].lower() == voter_email and vote.get('role_id') == role_id:
+        if vote['voter'] == voter_email and vote.get('role_id') == role_id:
             voter_votes[vote['candidate_id']] = {
                 'choice': vote['choice'],
                 'feedback': vote['feedback'],
@@ -472,23 +800,28 @@ def get_voter_role_progress_api():
 @login_required
 def results_page():
     """Display results page"""
-    return render_template('results.html')
+    return _render_page('results.html')
 
 @app.route('/api/results', methods=['GET'])
 @login_required
 def get_results():
     """Get voting results (only if all voters have voted on all candidates)"""
-    config = load_config()
-    votes_data = load_votes()
+    version, cached = _cached_response(_results_cache)
+    if cached is not None:
+        return cached
 
-    total_voters = get_total_voters()
-    total_candidates = get_total_candidates()
-    total_votes = len(votes_data['votes'])
+    config = _cached_config()
+
+    total_voters = get_total_voters(config)
+    total_candidates = get_total_candidates(config)
+    total_votes = count_votes()
     expected_votes = total_voters * total_candidates
 
-    # Check if voting is complete
-    if not is_voting_complete():
-        return jsonify({
+    # Check if voting is complete - only the count is needed for the very
+    # common "still waiting" polling case, so the full votes are not
+    # loaded until results can actually be shown
+    if total_voters == 0 or total_candidates == 0 or total_votes < expected_votes:
+        return _store_response(_results_cache, version, jsonify({
             'complete': False,
             'votes_received': total_votes,
             'votes_needed': expected_votes,
@@ -497,44 +830,45 @@ def get_results():
             'is_configured': config.get('is_configured', False),
             'total_voters': total_voters,
             'total_candidates': total_candidates
-        })
+        }))
 
-    # Build results for each candidate
+    # Build results for each candidate from the cached tallies
+    votes_data = _cached_votes()
+    tallies = _candidate_tallies(votes_data)
     candidates_results = []
     for candidate in config.get('candidates', []):
-        candidate_votes = [v for v in votes_data['votes'] if v['candidate_id'] == candidate['id']]
-
-        inclined = sum(1 for v in candidate_votes if v['choice'] == 'Inclined')
-        not_inclined = sum(1 for v in candidate_votes if v['choice'] == 'Not Inclined')
+        tally = tallies.get(candidate['id'])
+        if tally is None:
+            tally = {'inclined': 0, 'not_inclined': 0, 'votes': []}
 
         candidates_results.append({
             'id': candidate['id'],
             'name': candidate['name'],
-            'total_votes': len(candidate_votes),
-            'inclined': inclined,
-            'not_inclined': not_inclined,
-            'votes': candidate_votes
+            'total_votes': len(tally['votes']),
+            'inclined': tally['inclined'],
+            'not_inclined': tally['not_inclined'],
+            'votes': tally['votes']
         })
 
-    return jsonify({
+    return _store_response(_results_cache, version, jsonify({
         'complete': True,
         'position': config.get('position', ''),
         'total_voters': total_voters,
         'total_candidates': total_candidates,
         'candidates': candidates_results,
         'is_configured': config.get('is_configured', False)
-    })
+    }))
 
 @app.route('/api/results/<role_id>', methods=['GET'])
 @login_required
 def get_role_results(role_id):
     """Get voting results for a specific role (only if all voters have voted on all candidates)"""
-    role = get_role_by_id(role_id)
+    role = _cached_role(role_id)
 
     if not role:
         return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-    votes_data = load_votes()
+    votes_data = _cached_votes()
     role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id]
 
     total_voters = len(role.get('allowed_emails', []))
@@ -557,13 +891,20 @@ def get_role_results(role_id):
             'override': allow_results_override
         })
 
-    # Build results for each candidate in this role
+    # Bucket the role's votes by candidate in one pass; tallies come from
+    # the storage layer (a single GROUP BY on the database backend)
+    tallies = aggregate_votes(role_id)
+    votes_by_candidate = defaultdict(list)
+    for vote in role_votes:
+        votes_by_candidate[vote['candidate_id']].append(vote)
+
     candidates_results = []
     for candidate in role.get('candidates', []):
-        candidate_votes = [v for v in role_votes if v['candidate_id'] == candidate['id']]
+        candidate_votes = votes_by_candidate.get(candidate['id'], [])
 
-        inclined = sum(1 for v in candidate_votes if v['choice'] == 'Inclined')
-        not_inclined = sum(1 for v in candidate_votes if v['choice'] == 'Not Inclined')
+        choice_counts = tallies.get(candidate['id'], {})
+        inclined = choice_counts.get('Inclined', 0)
+        not_inclined = choice_counts.get('Not Inclined', 0)
 
         candidates_results.append({
             'id': candidate['id'],
@@ -591,7 +932,7 @@ def get_role_results(role_id):
 @login_required
 def admin_page():
     """Admin page for managing votes"""
-    return render_template('admin.html')
+    return _render_page('admin.html')
 
 @app.route('/api/reset', methods=['POST'])
 @login_required
@@ -606,6 +947,38 @@ def reset_votes():
     })
     return jsonify({'success': True, 'message': 'All votes and configuration have been reset'})
 
+def _sse_event(payload):
+    """Format one server-sent-event data frame"""
+    return 'data: ' + app.json.dumps(payload) + '\n\n'
+
+def _stream_summary(cache_key, cached_summary, user_prompt):
+    """Yield summary text deltas as SSE frames, caching the final text.
+
+    A cached summary is replayed as a single delta so streaming clients
+    behave the same on a cache hit.
+    """
+    if cached_summary is not None:
+        yield _sse_event({'delta': cached_summary})
+        yield _sse_event({'done': True})
+        return
+    try:
+        with claude_client.messages.stream(
+            model="claude-3-5-haiku-20241022",
+            max_tokens=2000,
+            temperature=0.3,
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ]
+        ) as stream:
+            pieces = []
+            for text in stream.text_stream:
+                pieces.append(text)
+                yield _sse_event({'delta': text})
+        _summary_cache_set(cache_key, ''.join(pieces).strip())
+        yield _sse_event({'done': True})
+    except Exception as e:
+        yield _sse_event({'error': f'Error generating summary: {str(e)}'})
+
 @app.route('/api/summarize', methods=['POST'])
 def summarize_feedback():
     """Summarize raw interview notes using Claude AI"""
@@ -622,6 +995,13 @@ def summarize_feedback():
     if not raw_notes:
         return jsonify({'success': False, 'message': 'Please provide notes to summarize'}), 400
 
+    # Identical notes + choice produce an identical summary - serve it from
+    # the cache instead of paying for another Claude call
+    cache_key = 'sum:' + hashlib.sha256((choice + '\0' + raw_notes).encode()).hexdigest()
+    cached_summary = _summary_cache_get(cache_key)
+    if cached_summary is not None and not request.args.get('stream'):
+        return jsonify({'success': True, 'summary': cached_summary})
+
     try:
         # Create prompt - choice may or may not be provided
         choice_context = ""
@@ -656,6 +1036,16 @@ Format the output as:
 Raw interview notes:
 {raw_notes}"""
 
+        # Opt-in streaming (?stream=1): emit text deltas as server-sent
+        # events so the client sees output immediately instead of waiting
+        # for the full generation
+        if request.args.get('stream') == '1':
+            return app.response_class(
+                _stream_summary(cache_key, cached_summary, user_prompt),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+
         response = claude_client.messages.create(
             model="claude-3-5-haiku-20241022",  # Fast and economical
             max_tokens=2000,  # Increased to preserve all details
@@ -666,6 +1056,7 @@ Raw interview notes:
         )
 
         summary = response.content[0].text.strip()
+        _summary_cache_set(cache_key, summary)
 
         return jsonify({
             'success': True,
@@ -687,33 +1078,47 @@ def generate_aggregate_summary(role_id, candidate_id):
             'message': 'AI summarization not configured.'
         }), 400
 
-    role = get_role_by_id(role_id)
+    role = _cached_role(role_id)
     if not role:
         return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-    candidate = next((c for c in role.get('candidates', []) if c['id'] == candidate_id), None)
+    candidate = _role_candidates_by_id(role).get(candidate_id)
     if not candidate:
         return jsonify({'success': False, 'message': 'Candidate not found'}), 404
 
-    votes_data = load_votes()
+    votes_data = _cached_votes()
     candidate_votes = [v for v in votes_data['votes']
                       if v.get('role_id') == role_id and v['candidate_id'] == candidate_id]
 
     if not candidate_votes:
         return jsonify({'success': False, 'message': 'No votes found for this candidate'}), 404
 
-    try:
-        # Build combined feedback text
-        feedback_text = f"Position: {role['position']}\nCandidate: {candidate['name']}\n\n"
-
-        inclined_count = sum(1 for v in candidate_votes if v['choice'] == 'Inclined')
-        not_inclined_count = sum(1 for v in candidate_votes if v['choice'] == 'Not Inclined')
+    # Fingerprint the votes that feed the summary - adding or updating any
+    # vote changes the key, so the cache invalidates itself
+    fingerprint = repr(sorted((v['voter'], v['choice'], v.get('feedback', '')) for v in candidate_votes))
+    cache_key = 'agg:' + hashlib.sha256(
+        (role_id + '\0' + candidate_id + '\0' + fingerprint).encode()
+    ).hexdigest()
+    cached_summary = _summary_cache_get(cache_key)
+    if cached_summary is not None:
+        return jsonify({'success': True, 'summary': cached_summary})
 
-        feedback_text += f"Vote Summary: {inclined_count} Inclined, {not_inclined_count} Not Inclined\n\n"
-        feedback_text += "Individual Voter Feedback:\n\n"
-
-        for i, vote in enumerate(candidate_votes, 1):
-            feedback_text += f"Voter {i} ({vote['choice']}):\n{vote.get('feedback', 'No feedback provided')}\n\n"
+    try:
+        # Build combined feedback text (list + join, not repeated string +=)
+        choice_counts = Counter(v['choice'] for v in candidate_votes)
+        inclined_count = choice_counts.get('Inclined', 0)
+        not_inclined_count = choice_counts.get('Not Inclined', 0)
+
+        parts = [
+            f"Position: {role['position']}\nCandidate: {candidate['name']}\n\n",
+            f"Vote Summary: {inclined_count} Inclined, {not_inclined_count} Not Inclined\n\n",
+            "Individual Voter Feedback:\n\n"
+        ]
+        parts.extend(
+            f"Voter {i} ({vote['choice']}):\n{vote.get('feedback', 'No feedback provided')}\n\n"
+            for i, vote in enumerate(candidate_votes, 1)
+        )
+        feedback_text = ''.join(parts)
 
         user_prompt = f"""You are reviewing interview feedback for a candidate. Below is the combined feedback from all interviewers.
 
@@ -748,6 +1153,7 @@ Be balanced, objective, and actionable. Highlight patterns across multiple voter
         )
 
         summary = response.content[0].text.strip()
+        _summary_cache_set(cache_key, summary)
 
         return jsonify({
             'success': True,
@@ -763,12 +1169,16 @@ Be balanced, objective, and actionable. Highlight patterns across multiple voter
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get current voting status"""
-    config = load_config()
-    votes_data = load_votes()
-    total_voters = get_total_voters()
-    total_candidates = get_total_candidates()
+    version, cached = _cached_response(_status_cache)
+    if cached is not None:
+        return cached
 
-    return jsonify({
+    config = _cached_config()
+    votes_data = _cached_votes()
+    total_voters = get_total_voters(config)
+    total_candidates = get_total_candidates(config)
+
+    return _store_response(_status_cache, version, jsonify({
         'total_votes': len(votes_data['votes']),
         'votes_needed': total_voters * total_candidates if config.get('is_configured') else 0,
         'is_configured': config.get('is_configured', False),
@@ -777,13 +1187,13 @@ def get_status():
         'voting_locked': len(votes_data['votes']) > 0,
         'total_voters': total_voters,
         'total_candidates': total_candidates
-    })
+    }))
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration"""
-    config = load_config()
-    votes_data = load_votes()
+    config = _cached_config()
+    votes_data = _cached_votes()
 
     return jsonify({
         'position': config.get('position', ''),
@@ -799,10 +1209,9 @@ def save_configuration():
     """Save voting configuration - allows adding candidates even after voting starts"""
     data = request.json
 
-    # Load existing config and votes
-    existing_config = load_config()
-    votes_data = load_votes()
-    has_votes = len(votes_data['votes']) > 0
+    # Load existing config; only vote counts are needed here
+    existing_config = _cached_config()
+    has_votes = count_votes() > 0
 
     position = data.get('position', '').strip()
     candidates = data.get('candidates', [])
@@ -858,8 +1267,9 @@ def save_configuration():
         return jsonify({'success': False, 'message': 'At least one candidate is required'}), 400
 
     # If votes exist, check that we're not removing candidates with votes
+    # (a SELECT DISTINCT on the database backend, not a full vote load)
     if has_votes:
-        voted_candidate_ids = set(vote['candidate_id'] for vote in votes_data['votes'])
+        voted_candidate_ids = distinct_voted_candidate_ids()
         new_candidate_ids = set(c['id'] for c in valid_candidates)
         removed_candidates = voted_candidate_ids - new_candidate_ids
 
@@ -876,7 +1286,7 @@ def save_configuration():
         email = email.strip()
         if email:
             # Basic email validation
-            if '@' not in email or '.' not in email:
+            if not EMAIL_RE.match(email):
                 return jsonify({'success': False, 'message': f'Invalid email format: {email}'}), 400
             valid_emails.append(email)
 
@@ -886,11 +1296,13 @@ def save_configuration():
     if len(valid_emails) > 5:
         return jsonify({'success': False, 'message': 'Maximum 5 voters allowed'}), 400
 
-    # Save configuration
+    # Save configuration (with the normalized email list precomputed so the
+    # vote hot path can do a set lookup instead of re-normalizing per request)
     config_data = {
         'position': position,
         'candidates': valid_candidates,
         'allowed_emails': valid_emails,
+        'allowed_emails_norm': sorted({email.strip().lower() for email in valid_emails}),
         'is_configured': True
     }
     save_config(config_data)
@@ -924,7 +1336,7 @@ def create_role():
     if not hiring_manager:
         return jsonify({'success': False, 'message': 'Hiring manager email is required'}), 400
 
-    if '@' not in hiring_manager or '.' not in hiring_manager:
+    if not EMAIL_RE.match(hiring_manager):
         return jsonify({'success': False, 'message': f'Invalid hiring manager email format: {hiring_manager}'}), 400
 
     # Validate and build candidates list
@@ -946,29 +1358,28 @@ def create_role():
     if len(valid_candidates) == 0:
         return jsonify({'success': False, 'message': 'At least one candidate is required'}), 400
 
-    # Validate emails
+    # Validate emails - reject on the first bad address or on exceeding the
+    # voter cap rather than building the full list first
     valid_emails = []
     for email in allowed_emails:
         email = email.strip()
         if email:
-            if '@' not in email or '.' not in email:
+            if not EMAIL_RE.match(email):
                 return jsonify({'success': False, 'message': f'Invalid email format: {email}'}), 400
+            if len(valid_emails) >= 5:
+                return jsonify({'success': False, 'message': 'Maximum 5 voters allowed'}), 400
             valid_emails.append(email)
 
     if len(valid_emails) == 0:
         return jsonify({'success': False, 'message': 'At least one voter email is required'}), 400
 
-    if len(valid_emails) > 5:
-        return jsonify({'success': False, 'message': 'Maximum 5 voters allowed'}), 400
-
     # Validate status
     if status not in ['active', 'fulfilled', 'expired']:
         status = 'active'
 
     # Create new role
     try:
-        import uuid
-        role_id = str(uuid.uuid4())
+        role_id = str(_uuid7())
 
         role = {
             'id': role_id,
@@ -982,8 +1393,8 @@ def create_role():
         }
 
         # Use save_role() to add only this role without affecting existing roles
-        # save_roles() would try to delete all roles, causing foreign key violations
         saved_role = save_role(role)
+        _invalidate_cached_roles()
 
         return jsonify({
             'success': True,
@@ -991,36 +1402,43 @@ def create_role():
             'role': saved_role
         })
     except Exception as e:
-        import traceback
         print(f"Error creating role: {traceback.format_exc()}")
         return jsonify({'success': False, 'message': f'Error creating role: {str(e)}'}), 500
 
+def _vote_stats(role, total_votes):
+    """The vote_stats block shared by the role list and detail endpoints"""
+    total_voters = len(role.get('allowed_emails', []))
+    total_candidates = len(role.get('candidates', []))
+    expected_votes = total_voters * total_candidates
+    return {
+        'total_votes': total_votes,
+        'expected_votes': expected_votes,
+        'is_complete': total_votes >= expected_votes if expected_votes > 0 else False
+    }
+
 @app.route('/api/roles', methods=['GET'])
 def list_roles():
     """List all roles with optional status filter"""
     try:
         status_filter = request.args.get('status')  # active, fulfilled, expired
 
-        roles_data = load_roles()
+        roles_data = _cached_roles()
         roles = roles_data['roles']
 
         # Filter by status if provided
         if status_filter:
             roles = [r for r in roles if r.get('status') == status_filter]
 
-        # Add vote counts to each role
-        votes_data = load_votes()
-        for role in roles:
-            role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role['id']]
-            total_voters = len(role.get('allowed_emails', []))
-            total_candidates = len(role.get('candidates', []))
-            expected_votes = total_voters * total_candidates
-
-            role['vote_stats'] = {
-                'total_votes': len(role_votes),
-                'expected_votes': expected_votes,
-                'is_complete': len(role_votes) >= expected_votes if expected_votes > 0 else False
-            }
+        # Add vote counts to each role (one GROUP BY on the database
+        # backend instead of re-scanning all votes per role)
+        # Copy each role before attaching stats: the loaded role dicts are
+        # shared by the storage cache and must not be mutated, and any
+        # derived caches riding on them must not reach the response
+        vote_counts = vote_counts_by_role()
+        roles = [
+            _public_role(role, vote_stats=_vote_stats(role, vote_counts.get(role['id'], 0)))
+            for role in roles
+        ]
 
         return jsonify({
             'success': True,
@@ -1028,7 +1446,6 @@ def list_roles():
             'total': len(roles)
         })
     except Exception as e:
-        import traceback
         print(f"Error listing roles: {traceback.format_exc()}")
         return jsonify({'success': False, 'message': f'Error loading roles: {str(e)}'}), 500
 
@@ -1040,18 +1457,10 @@ def get_role(role_id):
     if not role:
         return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-    # Add vote stats
-    votes_data = load_votes()
-    role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id]
-    total_voters = len(role.get('allowed_emails', []))
-    total_candidates = len(role.get('candidates', []))
-    expected_votes = total_voters * total_candidates
-
-    role['vote_stats'] = {
-        'total_votes': len(role_votes),
-        'expected_votes': expected_votes,
-        'is_complete': len(role_votes) >= expected_votes if expected_votes > 0 else False
-    }
+    # Add vote stats on a stripped copy (count only - no need to load the
+    # vote payloads, and the cached role dict must not be mutated or have
+    # its derived caches serialized)
+    role = _public_role(role, vote_stats=_vote_stats(role, count_votes(role_id)))
 
     return jsonify({
         'success': True,
@@ -1065,23 +1474,24 @@ def update_role(role_id):
     try:
         data = request.json
 
-        roles_data = load_roles()
-        role_index = None
-
-        for i, role in enumerate(roles_data['roles']):
-            if role['id'] == role_id:
-                role_index = i
-                break
-
-        if role_index is None:
+        # One storage call fetches the role and its voted candidate ids
+        # together - a single session on the database backend instead of
+        # two separate round-trips
+        role, voted_candidate_ids = get_role_with_voted_ids(role_id)
+        if role is None:
             return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-        role = roles_data['roles'][role_index]
-        votes_data = load_votes()
-        role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id]
-        has_votes = len(role_votes) > 0
+        # The JSON backend hands back the shared cached dict - build the
+        # update on a stripped copy so a request rejected partway through
+        # can't leak half-applied changes into the cache (and from there to
+        # disk on the next save), and so stale derived caches (_cand_by_id
+        # would contradict a reassigned candidates list) never reach the
+        # save payload or the response. Top-level keys only are reassigned
+        # below; the nested lists are never mutated in place.
+        role = _public_role(role)
+
+        has_votes = len(voted_candidate_ids) > 0
     except Exception as e:
-        import traceback
         print(f"Error loading role data: {traceback.format_exc()}")
         return jsonify({'success': False, 'message': f'Error loading role: {str(e)}'}), 500
 
@@ -1102,7 +1512,7 @@ def update_role(role_id):
         hiring_manager = data['hiring_manager'].strip()
         if hiring_manager:
             # Validate email format
-            if '@' not in hiring_manager or '.' not in hiring_manager:
+            if not EMAIL_RE.match(hiring_manager):
                 return jsonify({'success': False, 'message': f'Invalid hiring manager email format: {hiring_manager}'}), 400
             role['hiring_manager'] = hiring_manager
 
@@ -1116,13 +1526,14 @@ def update_role(role_id):
 
         if has_votes:
             # Can only add, not remove
-            existing_candidate_ids = set(c['id'] for c in role['candidates'])
-            voted_candidate_ids = set(v['candidate_id'] for v in role_votes)
-
             # Build new candidates list preserving IDs
             valid_candidates = []
-            existing_candidates = {c['id']: c for c in role['candidates']}
-            max_id = max([int(c['id']) for c in role['candidates']], default=0)
+            # One pass over the current candidates for both the id set and max
+            existing_candidate_ids = set()
+            max_id = 0
+            for c in role['candidates']:
+                existing_candidate_ids.add(c['id'])
+                max_id = max(max_id, int(c['id']))
 
             for candidate in new_candidates:
                 if isinstance(candidate, dict):
@@ -1135,7 +1546,7 @@ def update_role(role_id):
                 if not name:
                     continue
 
-                if candidate_id and candidate_id in existing_candidates:
+                if candidate_id and candidate_id in existing_candidate_ids:
                     valid_candidates.append({'id': candidate_id, 'name': name})
                 else:
                     max_id += 1
@@ -1176,7 +1587,7 @@ def update_role(role_id):
         for email in new_emails:
             email = email.strip()
             if email:
-                if '@' not in email or '.' not in email:
+                if not EMAIL_RE.match(email):
                     return jsonify({'success': False, 'message': f'Invalid email format: {email}'}), 400
                 valid_emails.append(email)
 
@@ -1189,6 +1600,7 @@ def update_role(role_id):
         # Use save_role() instead of save_roles() to update only this role
         # save_roles() tries to delete ALL roles which causes foreign key violations
         updated_role = save_role(role)
+        _invalidate_cached_roles()
 
         return jsonify({
             'success': True,
@@ -1196,7 +1608,6 @@ def update_role(role_id):
             'role': updated_role
         })
     except Exception as e:
-        import traceback
         print(f"Error saving role: {traceback.format_exc()}")
         return jsonify({'success': False, 'message': f'Error saving role: {str(e)}'}), 500
 
@@ -1204,42 +1615,37 @@ def update_role(role_id):
 @login_required
 def delete_role(role_id):
     """Delete a role (only if no votes exist)"""
-    roles_data = load_roles()
-    role_index = None
-
-    for i, role in enumerate(roles_data['roles']):
-        if role['id'] == role_id:
-            role_index = i
-            break
-
-    if role_index is None:
+    # Indexed PK lookup; only a vote count is needed for the guard
+    role = get_role_by_id(role_id)
+    if role is None:
         return jsonify({'success': False, 'message': 'Role not found'}), 404
 
-    # Check if role has votes
-    votes_data = load_votes()
-    role_votes = [v for v in votes_data['votes'] if v.get('role_id') == role_id]
-
-    if len(role_votes) > 0:
+    if role_has_votes(role_id):
         return jsonify({
             'success': False,
             'message': 'Cannot delete role with existing votes. Mark as expired instead.'
         }), 400
 
     # Remove role
-    deleted_role = roles_data['roles'].pop(role_index)
-    save_roles(roles_data)
+    delete_role_storage(role_id)
+    _invalidate_cached_roles()
 
     return jsonify({
         'success': True,
-        'message': f'Role "{deleted_role["position"]}" deleted successfully'
+        'message': f'Role "{role["position"]}" deleted successfully'
     })
 
+# Pre-render the static page shells at import time so the first hit on each
+# page (the entry point for every user) skips the template-loader work too
+with app.app_context():
+    for _page_template in ('vote.html', 'results.html', 'admin.html'):
+        _render_page(_page_template)
+
 if __name__ == '__main__':
     # Run migration on startup
     migrate_config_to_roles()
 
     # Get local IP for sharing with collaborators
-    import socket
 
     # Check if running in production or development
     port = int(os.environ.get('PORT', 5001))
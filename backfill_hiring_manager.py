@@ -43,7 +43,13 @@ def backfill_database():
 
 def backfill_json():
     """Backfill hiring manager for JSON files."""
-    import json
+    # orjson parses and serializes in C with far less intermediate memory;
+    # fall back to the stdlib like the rest of the storage layer does
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+        import json
 
     print("Backfilling hiring manager in JSON files...")
 
@@ -53,8 +59,9 @@ def backfill_json():
         print(f"✓ {roles_file} does not exist. Nothing to backfill.")
         return
 
-    with open(roles_file, 'r') as f:
-        data = json.load(f)
+    with open(roles_file, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     roles = data.get('roles', [])
 
@@ -75,8 +82,12 @@ def backfill_json():
         return
 
     # Save updated data
-    with open(roles_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(roles_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(roles_file, 'w') as f:
+            json.dump(data, f, indent=2)
 
     print(f"\n✓ Successfully updated {roles_updated} roles in {roles_file} with hiring manager: {DEFAULT_HIRING_MANAGER}")
 
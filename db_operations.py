@@ -6,20 +6,62 @@ All functions return the same data structures as the JSON equivalents for compat
 from database import db_session, get_session
 from models import Role, Candidate, AllowedVoter, Vote, Config
 from datetime import datetime
+import io
+from sqlalchemy import func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from functools import lru_cache
 import uuid
 
 
+@lru_cache(maxsize=1024)
+def _parse_uuid(value):
+    """Parse a role-id string into a UUID, memoized.
+
+    The same handful of role ids show up on every request while a vote is
+    open, and uuid.UUID re-parses the 36-char string each time; the cache
+    turns repeats into a dict hit.
+    """
+    return uuid.UUID(value)
+
+
 # ============= VOTES OPERATIONS =============
 
 def load_votes():
     """
     Load all votes from the database.
     Returns: {'votes': [list of vote dicts]}
+
+    Selects plain columns rather than Vote entities: every caller wants
+    dicts, so there is no reason to pay for instrumented ORM objects and
+    identity-map bookkeeping per row.
     """
     with db_session() as session:
-        votes = session.query(Vote).all()
+        # Stream in batches through a server-side cursor so peak memory
+        # holds one batch of rows plus the result dicts, not both full copies
+        rows = session.query(
+            Vote.voter,
+            Vote.candidate_id,
+            Vote.candidate_name,
+            Vote.role_id,
+            Vote.role_position,
+            Vote.choice,
+            Vote.feedback,
+            Vote.timestamp
+        ).execution_options(stream_results=True).yield_per(500)
         return {
-            'votes': [vote.to_dict() for vote in votes]
+            'votes': [
+                {
+                    'voter': row.voter,
+                    'candidate_id': row.candidate_id,
+                    'candidate_name': row.candidate_name,
+                    'role_id': str(row.role_id) if row.role_id else None,
+                    'role_position': row.role_position,
+                    'choice': row.choice,
+                    'feedback': row.feedback,
+                    'timestamp': row.timestamp.isoformat() if row.timestamp else None
+                }
+                for row in rows
+            ]
         }
 
 
@@ -29,26 +71,177 @@ def save_votes(data):
     Note: This replaces all existing votes (for compatibility with JSON behavior).
     In practice, votes are added individually via save_vote().
 
+    Upserts on the (voter, candidate_id, role_id) uniqueness constraint and
+    deletes only rows absent from the payload, instead of the old
+    delete-everything-and-reinsert, so unchanged votes are updated in place
+    rather than churned through DELETE + INSERT.
+
     Args:
         data: {'votes': [list of vote dicts]}
     """
+    rows = [
+        {
+            'voter': vote_data['voter'],
+            'candidate_id': vote_data['candidate_id'],
+            'candidate_name': vote_data.get('candidate_name'),
+            'role_id': _parse_uuid(vote_data['role_id']) if vote_data.get('role_id') else None,
+            'role_position': vote_data.get('role_position'),
+            'choice': vote_data['choice'],
+            'feedback': vote_data.get('feedback'),
+            'timestamp': datetime.fromisoformat(vote_data['timestamp']) if vote_data.get('timestamp') else datetime.utcnow()
+        }
+        for vote_data in data.get('votes', [])
+    ]
+
     with db_session() as session:
-        # Clear existing votes
-        session.query(Vote).delete()
-
-        # Add new votes
-        for vote_data in data.get('votes', []):
-            vote = Vote(
-                voter=vote_data['voter'],
-                candidate_id=vote_data['candidate_id'],
-                candidate_name=vote_data.get('candidate_name'),
-                role_id=uuid.UUID(vote_data['role_id']) if vote_data.get('role_id') else None,
-                role_position=vote_data.get('role_position'),
-                choice=vote_data['choice'],
-                feedback=vote_data.get('feedback'),
-                timestamp=datetime.fromisoformat(vote_data['timestamp']) if vote_data.get('timestamp') else datetime.utcnow()
-            )
-            session.add(vote)
+        if not rows:
+            session.query(Vote).delete()
+            return
+
+        # Drop rows not present in the payload (row-value IN is native SQL)
+        keys = [(r['voter'], r['candidate_id'], r['role_id']) for r in rows]
+        session.query(Vote).filter(
+            ~tuple_(Vote.voter, Vote.candidate_id, Vote.role_id).in_(keys)
+        ).delete(synchronize_session=False)
+
+        stmt = pg_insert(Vote).values(rows)
+        session.execute(stmt.on_conflict_do_update(
+            constraint='uq_voter_candidate_role',
+            set_={
+                'candidate_name': stmt.excluded.candidate_name,
+                'role_position': stmt.excluded.role_position,
+                'choice': stmt.excluded.choice,
+                'feedback': stmt.excluded.feedback,
+                'timestamp': stmt.excluded.timestamp,
+            }
+        ))
+
+
+def _copy_field(value):
+    """Render one value for PostgreSQL COPY text format"""
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\') \
+        .replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+_VOTE_COPY_COLUMNS = ('voter, candidate_id, candidate_name, role_id, '
+                      'role_position, choice, feedback, timestamp')
+
+
+def _votes_copy_buffer(vote_rows):
+    """Serialize vote dicts into a COPY text-format buffer"""
+    buf = io.StringIO()
+    for v in vote_rows:
+        buf.write('\t'.join((
+            _copy_field(v['voter']),
+            _copy_field(v['candidate_id']),
+            _copy_field(v.get('candidate_name')),
+            _copy_field(v['role_id']) if v.get('role_id') else '\\N',
+            _copy_field(v.get('role_position')),
+            _copy_field(v['choice']),
+            _copy_field(v.get('feedback')),
+            _copy_field(v.get('timestamp') or datetime.utcnow().isoformat())
+        )))
+        buf.write('\n')
+    buf.seek(0)
+    return buf
+
+
+# Below this row count COPY's setup cost outweighs its throughput win;
+# a single multi-row INSERT (insertmanyvalues) does fewer round-trips
+_COPY_THRESHOLD = 500
+
+
+def _vote_insert_params(vote_rows):
+    """Vote dicts as Core-insert parameter rows (typed, not COPY text)"""
+    rows = []
+    for v in vote_rows:
+        ts = v.get('timestamp')
+        rows.append({
+            'voter': v['voter'],
+            'candidate_id': v['candidate_id'],
+            'candidate_name': v.get('candidate_name'),
+            'role_id': _parse_uuid(v['role_id']) if v.get('role_id') else None,
+            'role_position': v.get('role_position'),
+            'choice': v['choice'],
+            'feedback': v.get('feedback'),
+            'timestamp': datetime.fromisoformat(ts) if isinstance(ts, str) else (ts or datetime.utcnow())
+        })
+    return rows
+
+
+def bulk_save_votes(vote_rows):
+    """
+    Bulk-ingest votes. Large batches stream through COPY FROM STDIN - one
+    protocol message stream instead of a round-trip per row; small batches
+    go through one multi-row INSERT (SQLAlchemy's insertmanyvalues), which
+    skips COPY's setup cost.
+
+    Appends only; use bulk_upsert_votes when rows may already exist, or
+    save_votes for replace semantics. Rows use the same dict shape as
+    save_vote.
+
+    Args:
+        vote_rows: list of vote dicts
+    """
+    if not vote_rows:
+        return
+
+    if len(vote_rows) < _COPY_THRESHOLD:
+        rows = _vote_insert_params(vote_rows)
+        with db_session() as session:
+            session.execute(Vote.__table__.insert(), rows)
+        return
+
+    buf = _votes_copy_buffer(vote_rows)
+    with db_session() as session:
+        # COPY is not expressible through the ORM - drop to the DBAPI cursor
+        cursor = session.connection().connection.cursor()
+        cursor.copy_expert(
+            f'COPY votes ({_VOTE_COPY_COLUMNS}) FROM STDIN',
+            buf
+        )
+
+
+def bulk_upsert_votes(vote_rows):
+    """
+    Bulk add-or-update votes: COPY into a temp staging table, then one
+    server-side INSERT ... SELECT ... ON CONFLICT merge. The server does
+    the whole merge with one statement's worth of parse/plan instead of a
+    per-row upsert round-trip.
+
+    Args:
+        vote_rows: list of vote dicts (same shape as save_vote)
+    """
+    if not vote_rows:
+        return
+
+    buf = _votes_copy_buffer(vote_rows)
+    with db_session() as session:
+        cursor = session.connection().connection.cursor()
+        cursor.execute(
+            'CREATE TEMP TABLE votes_stage '
+            '(LIKE votes INCLUDING DEFAULTS) ON COMMIT DROP'
+        )
+        cursor.copy_expert(
+            f'COPY votes_stage ({_VOTE_COPY_COLUMNS}) FROM STDIN',
+            buf
+        )
+        # DISTINCT ON + ctid keeps the last occurrence per key: ON CONFLICT
+        # refuses to update the same target row twice in one statement
+        cursor.execute(
+            f'INSERT INTO votes ({_VOTE_COPY_COLUMNS}) '
+            f'SELECT DISTINCT ON (voter, candidate_id, role_id) {_VOTE_COPY_COLUMNS} '
+            'FROM votes_stage '
+            'ORDER BY voter, candidate_id, role_id, ctid DESC '
+            'ON CONFLICT ON CONSTRAINT uq_voter_candidate_role DO UPDATE SET '
+            'candidate_name = EXCLUDED.candidate_name, '
+            'role_position = EXCLUDED.role_position, '
+            'choice = EXCLUDED.choice, '
+            'feedback = EXCLUDED.feedback, '
+            'timestamp = EXCLUDED.timestamp'
+        )
 
 
 def save_vote(vote_data):
@@ -56,37 +249,124 @@ def save_vote(vote_data):
     Save or update a single vote.
     Replaces existing vote if voter already voted for this candidate in this role.
 
+    One INSERT ... ON CONFLICT DO UPDATE on the uq_voter_candidate_role
+    constraint - a single round-trip with no SELECT-then-write race window.
+
     Args:
         vote_data: dict with voter, candidate_id, role_id, choice, feedback, etc.
     """
+    stmt = pg_insert(Vote).values(
+        voter=vote_data['voter'],
+        candidate_id=vote_data['candidate_id'],
+        candidate_name=vote_data.get('candidate_name'),
+        role_id=_parse_uuid(vote_data['role_id']) if vote_data.get('role_id') else None,
+        role_position=vote_data.get('role_position'),
+        choice=vote_data['choice'],
+        feedback=vote_data.get('feedback'),
+        timestamp=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint='uq_voter_candidate_role',
+        set_={
+            'candidate_name': stmt.excluded.candidate_name,
+            'role_position': stmt.excluded.role_position,
+            'choice': stmt.excluded.choice,
+            'feedback': stmt.excluded.feedback,
+            'timestamp': stmt.excluded.timestamp,
+        }
+    )
     with db_session() as session:
-        # Check if vote already exists
-        existing_vote = session.query(Vote).filter_by(
-            voter=vote_data['voter'],
-            candidate_id=vote_data['candidate_id'],
-            role_id=uuid.UUID(vote_data['role_id']) if vote_data.get('role_id') else None
-        ).first()
-
-        if existing_vote:
-            # Update existing vote
-            existing_vote.choice = vote_data['choice']
-            existing_vote.feedback = vote_data.get('feedback')
-            existing_vote.timestamp = datetime.utcnow()
-            existing_vote.candidate_name = vote_data.get('candidate_name')
-            existing_vote.role_position = vote_data.get('role_position')
-        else:
-            # Create new vote
-            vote = Vote(
-                voter=vote_data['voter'],
-                candidate_id=vote_data['candidate_id'],
-                candidate_name=vote_data.get('candidate_name'),
-                role_id=uuid.UUID(vote_data['role_id']) if vote_data.get('role_id') else None,
-                role_position=vote_data.get('role_position'),
-                choice=vote_data['choice'],
-                feedback=vote_data.get('feedback'),
-                timestamp=datetime.utcnow()
-            )
-            session.add(vote)
+        session.execute(stmt)
+
+
+def count_votes(role_id=None):
+    """
+    Count votes with a single SELECT count(*) query.
+
+    Args:
+        role_id: optional role UUID string to scope the count
+    Returns:
+        Number of votes as an int
+    """
+    with db_session() as session:
+        query = session.query(func.count(Vote.id))
+        if role_id is not None:
+            if isinstance(role_id, str):
+                role_id = _parse_uuid(role_id)
+            query = query.filter(Vote.role_id == role_id)
+        return query.scalar()
+
+
+def role_has_votes(role_id):
+    """
+    Check whether a role has any votes with an EXISTS query.
+
+    Args:
+        role_id: UUID string or UUID object
+    Returns:
+        True if at least one vote exists for the role
+    """
+    with db_session() as session:
+        if isinstance(role_id, str):
+            role_id = _parse_uuid(role_id)
+        return session.query(
+            session.query(Vote.id).filter_by(role_id=role_id).exists()
+        ).scalar()
+
+
+def distinct_voted_candidate_ids(role_id=None):
+    """
+    Distinct candidate_ids that have at least one vote.
+
+    Args:
+        role_id: optional role UUID string to scope the query
+    Returns:
+        Set of candidate_id strings
+    """
+    with db_session() as session:
+        query = session.query(Vote.candidate_id).distinct()
+        if role_id is not None:
+            if isinstance(role_id, str):
+                role_id = _parse_uuid(role_id)
+            query = query.filter(Vote.role_id == role_id)
+        return {row[0] for row in query}
+
+
+def vote_counts_by_role():
+    """
+    Count votes per role with a single GROUP BY query.
+
+    Returns:
+        {role_id string: count} (legacy votes with no role appear under None)
+    """
+    with db_session() as session:
+        rows = session.query(Vote.role_id, func.count(Vote.id)).group_by(Vote.role_id).all()
+        return {str(role_id) if role_id else None: count for role_id, count in rows}
+
+
+def aggregate_votes(role_id=None):
+    """
+    Tally votes per candidate with a single GROUP BY query.
+
+    Args:
+        role_id: optional role UUID string to scope the tallies
+    Returns:
+        {candidate_id: {choice: count}}
+    """
+    with db_session() as session:
+        query = session.query(
+            Vote.candidate_id, Vote.choice, func.count()
+        ).group_by(Vote.candidate_id, Vote.choice)
+
+        if role_id is not None:
+            if isinstance(role_id, str):
+                role_id = _parse_uuid(role_id)
+            query = query.filter(Vote.role_id == role_id)
+
+        tallies = {}
+        for candidate_id, choice, count in query:
+            tallies.setdefault(candidate_id, {})[choice] = count
+        return tallies
 
 
 # ============= ROLES OPERATIONS =============
@@ -97,6 +377,8 @@ def load_roles():
     Returns: {'roles': [list of role dicts with candidates and allowed_emails]}
     """
     with db_session() as session:
+        # Children arrive via the relationships' selectin loading - two
+        # batched queries for all roles, regardless of role count
         roles = session.query(Role).all()
         return {
             'roles': [role.to_dict() for role in roles]
@@ -109,43 +391,28 @@ def save_roles(data):
     Note: This replaces all existing roles (for compatibility with JSON behavior).
     Use save_role() for individual role operations.
 
+    Applies each role through the same diff logic as save_role and deletes
+    only roles absent from the payload, instead of the old whole-table
+    DELETE - which cascaded through every candidate and allowed-voter row
+    and tripped the votes foreign key for any role with votes.
+
     Args:
         data: {'roles': [list of role dicts]}
     """
     with db_session() as session:
-        # Clear existing roles (cascades to candidates and allowed_voters)
-        session.query(Role).delete()
-
-        # Add new roles
-        for role_data in data.get('roles', []):
-            role = Role(
-                id=uuid.UUID(role_data['id']) if 'id' in role_data else uuid.uuid4(),
-                position=role_data['position'],
-                hiring_manager=role_data.get('hiring_manager'),
-                status=role_data.get('status', 'active'),
-                allow_results_override=role_data.get('allow_results_override', False),
-                created_at=datetime.fromisoformat(role_data['created_at']) if role_data.get('created_at') else datetime.utcnow(),
-                updated_at=datetime.fromisoformat(role_data['updated_at']) if role_data.get('updated_at') else None
-            )
-
-            # Add candidates
-            for candidate_data in role_data.get('candidates', []):
-                candidate = Candidate(
-                    role=role,
-                    candidate_id=candidate_data['id'],
-                    name=candidate_data['name']
-                )
-                session.add(candidate)
+        new_ids = {
+            _parse_uuid(role_data['id'])
+            for role_data in data.get('roles', [])
+            if 'id' in role_data
+        }
 
-            # Add allowed voters
-            for email in role_data.get('allowed_emails', []):
-                voter = AllowedVoter(
-                    role=role,
-                    email=email
-                )
-                session.add(voter)
+        removed = session.query(Role).filter(~Role.id.in_(new_ids)) if new_ids \
+            else session.query(Role)
+        for role in removed:
+            session.delete(role)
 
-            session.add(role)
+        for role_data in data.get('roles', []):
+            _apply_role(session, role_data)
 
 
 def save_role(role_data):
@@ -158,71 +425,89 @@ def save_role(role_data):
         The saved role as a dict
     """
     with db_session() as session:
-        role_id = uuid.UUID(role_data['id']) if 'id' in role_data else uuid.uuid4()
-
-        # Check if role exists
-        existing_role = session.query(Role).filter_by(id=role_id).first()
-
-        if existing_role:
-            # Update existing role
-            existing_role.position = role_data['position']
-            existing_role.hiring_manager = role_data.get('hiring_manager')
-            existing_role.status = role_data.get('status', 'active')
-            existing_role.allow_results_override = role_data.get('allow_results_override', False)
-            existing_role.updated_at = datetime.utcnow()
-
-            # Update candidates (delete old, add new)
-            session.query(Candidate).filter_by(role_id=role_id).delete()
-            for candidate_data in role_data.get('candidates', []):
-                candidate = Candidate(
-                    role=existing_role,
-                    candidate_id=candidate_data['id'],
-                    name=candidate_data['name']
-                )
-                session.add(candidate)
-
-            # Update allowed voters (delete old, add new)
-            session.query(AllowedVoter).filter_by(role_id=role_id).delete()
-            for email in role_data.get('allowed_emails', []):
-                voter = AllowedVoter(
+        role = _apply_role(session, role_data)
+        session.flush()  # Ensure relationships are loaded
+        return role.to_dict()
+
+
+def _apply_role(session, role_data):
+    """Insert or update one role (and its children, by diff) in the session"""
+    role_id = _parse_uuid(role_data['id']) if 'id' in role_data else uuid.uuid4()
+
+    # Check if role exists
+    existing_role = session.query(Role).filter_by(id=role_id).first()
+
+    if existing_role:
+        # Update existing role
+        existing_role.position = role_data['position']
+        existing_role.hiring_manager = role_data.get('hiring_manager')
+        existing_role.status = role_data.get('status', 'active')
+        existing_role.allow_results_override = role_data.get('allow_results_override', False)
+        # Touch updated_at explicitly: onupdate only fires when the roles row
+        # itself changes, so a child-only diff (new candidate or voter with
+        # the scalar columns re-sent unchanged) would otherwise leave it - and
+        # the (id, updated_at)-keyed to_dict cache - stale
+        existing_role.updated_at = datetime.utcnow()
+
+        # Diff candidates instead of delete-all-and-reinsert: a typical
+        # status-only update touches zero child rows
+        new_candidates = {c['id']: c['name'] for c in role_data.get('candidates', [])}
+        existing_candidates = {c.candidate_id: c for c in existing_role.candidates}
+
+        for candidate_id in set(existing_candidates) - set(new_candidates):
+            session.delete(existing_candidates[candidate_id])
+        for candidate_id, name in new_candidates.items():
+            candidate = existing_candidates.get(candidate_id)
+            if candidate is None:
+                session.add(Candidate(
                     role=existing_role,
-                    email=email
-                )
-                session.add(voter)
+                    candidate_id=candidate_id,
+                    name=name
+                ))
+            elif candidate.name != name:
+                candidate.name = name
+
+        # Same diff for allowed voters
+        new_emails = set(role_data.get('allowed_emails', []))
+        existing_voters = {v.email: v for v in existing_role.allowed_voters}
+
+        for email in set(existing_voters) - new_emails:
+            session.delete(existing_voters[email])
+        for email in new_emails - set(existing_voters):
+            session.add(AllowedVoter(role=existing_role, email=email))
+
+        role = existing_role
+    else:
+        # Create new role
+        role = Role(
+            id=role_id,
+            position=role_data['position'],
+            hiring_manager=role_data.get('hiring_manager'),
+            status=role_data.get('status', 'active'),
+            allow_results_override=role_data.get('allow_results_override', False),
+            created_at=datetime.utcnow()
+        )
+
+        # Add candidates
+        for candidate_data in role_data.get('candidates', []):
+            candidate = Candidate(
+                role=role,
+                candidate_id=candidate_data['id'],
+                name=candidate_data['name']
+            )
+            session.add(candidate)
 
-            role = existing_role
-        else:
-            # Create new role
-            role = Role(
-                id=role_id,
-                position=role_data['position'],
-                hiring_manager=role_data.get('hiring_manager'),
-                status=role_data.get('status', 'active'),
-                allow_results_override=role_data.get('allow_results_override', False),
-                created_at=datetime.utcnow()
+        # Add allowed voters
+        for email in role_data.get('allowed_emails', []):
+            voter = AllowedVoter(
+                role=role,
+                email=email
             )
+            session.add(voter)
 
-            # Add candidates
-            for candidate_data in role_data.get('candidates', []):
-                candidate = Candidate(
-                    role=role,
-                    candidate_id=candidate_data['id'],
-                    name=candidate_data['name']
-                )
-                session.add(candidate)
-
-            # Add allowed voters
-            for email in role_data.get('allowed_emails', []):
-                voter = AllowedVoter(
-                    role=role,
-                    email=email
-                )
-                session.add(voter)
-
-            session.add(role)
+        session.add(role)
 
-        session.flush()  # Ensure relationships are loaded
-        return role.to_dict()
+    return role
 
 
 def get_role_by_id(role_id):
@@ -236,12 +521,38 @@ def get_role_by_id(role_id):
     """
     with db_session() as session:
         if isinstance(role_id, str):
-            role_id = uuid.UUID(role_id)
+            role_id = _parse_uuid(role_id)
 
         role = session.query(Role).filter_by(id=role_id).first()
         return role.to_dict() if role else None
 
 
+def get_role_with_voted_ids(role_id):
+    """
+    Fetch a role and the distinct candidate_ids that have votes for it,
+    in one session - the role-update path needs both, and separate calls
+    meant two connection checkouts and two transactions.
+
+    Args:
+        role_id: UUID string or UUID object
+    Returns:
+        (role dict or None, set of candidate_id strings)
+    """
+    with db_session() as session:
+        if isinstance(role_id, str):
+            role_id = _parse_uuid(role_id)
+
+        role = session.query(Role).filter_by(id=role_id).first()
+        if role is None:
+            return None, set()
+
+        voted_ids = {
+            row[0] for row in
+            session.query(Vote.candidate_id).filter(Vote.role_id == role_id).distinct()
+        }
+        return role.to_dict(), voted_ids
+
+
 def delete_role(role_id):
     """
     Delete a role by ID.
@@ -254,7 +565,7 @@ def delete_role(role_id):
     """
     with db_session() as session:
         if isinstance(role_id, str):
-            role_id = uuid.UUID(role_id)
+            role_id = _parse_uuid(role_id)
 
         role = session.query(Role).filter_by(id=role_id).first()
         if role:
@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for production.
+
+Every endpoint here is I/O-bound - storage reads/writes and, for the
+summarization endpoints, multi-second Claude API calls - so gevent workers
+are used when available: one worker can keep hundreds of requests in
+flight instead of pinning a thread per Claude call. Falls back to gthread
+workers when gevent is not installed. The storage layer is safe under
+either model: the in-process caches are guarded by a lock, and concurrent
+workers converge through atomic file replaces plus mtime-based cache
+invalidation.
+"""
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '5001')
+
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+try:
+    import gevent  # noqa: F401
+    if os.environ.get('DATABASE_URL'):
+        # monkey.patch_all() cannot reach psycopg2's C-level sockets, so a
+        # gevent worker without psycogreen would stall every in-flight
+        # request behind each database call. Require psycogreen on the
+        # database path (app.py applies the patch) or fall back to gthread.
+        import psycogreen.gevent  # noqa: F401
+    worker_class = 'gevent'
+    worker_connections = 200
+except ImportError:
+    worker_class = 'gthread'
+    threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Recycle workers periodically so a slow leak can't accumulate forever
+max_requests = 1000
+max_requests_jitter = 100
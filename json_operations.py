@@ -4,72 +4,396 @@ These functions work with JSON files: votes.json, roles.json, config.json
 """
 import json
 import os
+import threading
+
+# Use orjson when available - ~5x faster than stdlib json and works on bytes
+# directly. ujson is the next-best C parser; the stdlib fallback keeps both
+# optional dependencies.
+try:
+    import orjson
+
+    def _loads(buf):
+        return orjson.loads(buf)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    try:
+        import ujson
+
+        def _loads(buf):
+            return ujson.loads(buf)
+
+        def _dumps(obj):
+            return ujson.dumps(obj, ensure_ascii=False).encode()
+    except ImportError:
+        def _loads(buf):
+            return json.loads(buf)
+
+        def _dumps(obj):
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
 
 VOTES_FILE = 'votes.json'
+VOTES_LOG = 'votes.log'
 CONFIG_FILE = 'config.json'
 ROLES_FILE = 'roles.json'
 
+# In-process caches keyed on file mtime so repeated reads between writes skip
+# the open/read/parse cycle entirely. Guarded by a lock because the Flask dev
+# server and gunicorn workers can serve requests from multiple threads.
+_cache_lock = threading.Lock()
+_votes_cache = {'state': None, 'data': None, 'index': None, 'log_size': 0}
+_config_cache = {'mtime': None, 'data': None}
+_roles_cache = {'mtime': None, 'data': None, 'by_id': None}
+
+
+def _votes_state():
+    """(votes.json mtime, votes.log mtime) cache key; None for a missing file"""
+    try:
+        snapshot = os.stat(VOTES_FILE).st_mtime_ns
+    except FileNotFoundError:
+        snapshot = None
+    try:
+        log = os.stat(VOTES_LOG).st_mtime_ns
+    except FileNotFoundError:
+        log = None
+    return (snapshot, log)
+
+
+def _atomic_write_json(path, data):
+    """Serialize a dict and atomically replace path with the result.
+
+    One buffered write of the full payload to a temp file, then os.replace,
+    so readers only ever see a complete file. Underscore-prefixed keys are
+    in-memory derived caches and are never written out.
+    """
+    payload = _dumps({k: v for k, v in data.items() if not k.startswith('_')})
+    # pid alone is not unique under gthread workers - two threads saving
+    # concurrently would interleave writes into one temp file and os.replace
+    # could install the mangled result
+    tmp = '%s.tmp.%d.%d' % (path, os.getpid(), threading.get_ident())
+    with open(tmp, 'wb', buffering=65536) as f:
+        f.write(payload)
+        f.flush()
+        # One fsync per save: the rename below is only crash-safe if the
+        # temp file's contents are on disk first
+        os.fsync(f.fileno())
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+    os.replace(tmp, path)
+    # os.replace keeps the inode's timestamps, so this mtime identifies
+    # exactly the payload written here. Callers use it as their cache key:
+    # if any other writer replaces the file afterwards, the on-disk mtime
+    # no longer matches and the next load re-reads instead of trusting a
+    # cache entry that was keyed after the fact.
+    return mtime_ns
+
+
+def data_version():
+    """Opaque token that changes whenever votes or config change on disk.
+
+    Lets callers cache fully-serialized responses and serve them unchanged
+    until one of the underlying files is rewritten.
+    """
+    try:
+        config = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        config = None
+    return (_votes_state(), config)
+
+
+def _vote_key(vote):
+    """Identity of a vote record: one vote per voter/candidate/role"""
+    return (vote['voter'].lower(), vote['candidate_id'], vote.get('role_id'))
+
+
+def _apply_vote(data, index, record):
+    """Insert or replace a vote record in the list, keeping the index current"""
+    key = _vote_key(record)
+    position = index.get(key)
+    if position is None:
+        position = len(data['votes'])
+        index[key] = position
+        data['votes'].append(record)
+    else:
+        data['votes'][position] = record
+
+    # Keep the app-level per-voter index (if one has been built) current too,
+    # and drop the cached per-candidate tallies - they are stale now
+    by_voter = data.get('_by_voter')
+    if by_voter is not None:
+        by_voter.setdefault(key[0], {})[(record['candidate_id'], record.get('role_id'))] = position
+    data.pop('_tallies', None)
+
 
 def load_votes():
-    """Load votes from JSON file"""
-    if os.path.exists(VOTES_FILE):
-        with open(VOTES_FILE, 'r') as f:
-            return json.load(f)
-    return {'votes': []}
+    """Load votes (snapshot + append log, cached until the files change on disk)"""
+    state = _votes_state()
+    if state == (None, None):
+        return {'votes': []}
+
+    with _cache_lock:
+        if _votes_cache['state'] == state:
+            return _votes_cache['data']
+
+    try:
+        with open(VOTES_FILE, 'rb') as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        data = {'votes': []}
+
+    index = {_vote_key(v): i for i, v in enumerate(data['votes'])}
+
+    # Replay the append-only log over the snapshot (last write wins),
+    # remembering how many bytes were consumed so the append paths can tell
+    # whether a later write landed exactly where the cache expects
+    log_size = 0
+    try:
+        with open(VOTES_LOG, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    _apply_vote(data, index, _loads(line))
+            log_size = f.tell()
+    except FileNotFoundError:
+        pass
+
+    with _cache_lock:
+        _votes_cache['state'] = state
+        _votes_cache['data'] = data
+        _votes_cache['index'] = index
+        _votes_cache['log_size'] = log_size
+    return data
+
+
+def _append_to_log(data, vote_rows, payload):
+    """Append serialized votes to the log and fold them into the cache.
+
+    The cache key must never absorb another worker's concurrent append
+    while the cached data misses it, so instead of re-stat'ing the file
+    after the fact: fstat captures the log's size and mtime right after
+    this write, and the payload must land exactly where the bytes replayed
+    at load time ended. On any mismatch the cache is dropped so the next
+    load re-reads the log from disk.
+    """
+    with open(VOTES_LOG, 'ab') as f:
+        f.write(payload)
+        end = f.tell()
+        st = os.fstat(f.fileno())
+
+    with _cache_lock:
+        if (_votes_cache['data'] is not data
+                or _votes_cache['state'] is None
+                or end - len(payload) != _votes_cache['log_size']
+                or st.st_size != end):
+            # Another writer appended around this one - invalidate rather
+            # than guess, the next load replays the full log
+            _votes_cache['state'] = None
+            return
+        for vote in vote_rows:
+            _apply_vote(data, _votes_cache['index'], vote)
+        _votes_cache['log_size'] = end
+        _votes_cache['state'] = (_votes_cache['state'][0], st.st_mtime_ns)
+
+
+def append_vote(vote_data):
+    """Add or update a single vote by appending one line to the votes log.
+
+    This avoids rewriting the whole votes file per vote; load_votes folds
+    the log back in with last-write-wins semantics per voter/candidate/role.
+    """
+    data = load_votes()  # make sure the cache (and its index) is current
+    _append_to_log(data, [vote_data], _dumps(vote_data) + b'\n')
+
+
+def bulk_save_votes(vote_rows):
+    """Add or update many votes with a single append to the votes log"""
+    if not vote_rows:
+        return
+    data = load_votes()  # make sure the cache (and its index) is current
+    _append_to_log(data, vote_rows, b''.join(_dumps(vote) + b'\n' for vote in vote_rows))
 
 
 def save_votes(data):
-    """Save votes to JSON file"""
-    with open(VOTES_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save the full votes snapshot (write-to-temp + atomic rename).
+
+    Clears the append log: callers pass the complete current state, so any
+    pending log entries are already folded into the snapshot.
+    """
+    snapshot_mtime = _atomic_write_json(VOTES_FILE, data)
+    try:
+        os.remove(VOTES_LOG)
+    except FileNotFoundError:
+        pass
+
+    # Write-through keyed on exactly the snapshot written above - if another
+    # worker rewrites the snapshot or recreates the log afterwards, the
+    # on-disk state stops matching this key and the next read reloads
+    with _cache_lock:
+        _votes_cache['state'] = (snapshot_mtime, None)
+        _votes_cache['data'] = data
+        _votes_cache['index'] = {_vote_key(v): i for i, v in enumerate(data['votes'])}
+        _votes_cache['log_size'] = 0
+
+
+def count_votes(role_id=None):
+    """Count votes, optionally scoped to one role"""
+    votes = load_votes()['votes']
+    if role_id is None:
+        return len(votes)
+    return sum(1 for v in votes if v.get('role_id') == role_id)
+
+
+def role_has_votes(role_id):
+    """Check whether any vote exists for a role"""
+    return any(v.get('role_id') == role_id for v in load_votes()['votes'])
+
+
+def distinct_voted_candidate_ids(role_id=None):
+    """Distinct candidate ids that have at least one vote"""
+    votes = load_votes()['votes']
+    if role_id is None:
+        return {v['candidate_id'] for v in votes}
+    return {v['candidate_id'] for v in votes if v.get('role_id') == role_id}
+
+
+def vote_counts_by_role():
+    """Count votes per role ({role_id: count}) in one pass"""
+    counts = {}
+    for vote in load_votes()['votes']:
+        role_id = vote.get('role_id')
+        counts[role_id] = counts.get(role_id, 0) + 1
+    return counts
+
+
+def aggregate_votes(role_id=None):
+    """Tally votes per candidate ({candidate_id: {choice: count}}) in one pass"""
+    tallies = {}
+    for vote in load_votes()['votes']:
+        if role_id is not None and vote.get('role_id') != role_id:
+            continue
+        counts = tallies.setdefault(vote['candidate_id'], {})
+        counts[vote['choice']] = counts.get(vote['choice'], 0) + 1
+    return tallies
 
 
 def load_config():
-    """Load configuration from JSON file"""
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            # Migrate old format to new format if needed
-            if 'candidate_name' in config and 'candidates' not in config:
-                # Old format - convert to new
-                if config.get('candidate_name'):
-                    config['candidates'] = [{'id': '1', 'name': config['candidate_name']}]
-                else:
-                    config['candidates'] = []
-                del config['candidate_name']
-            return config
-    return {
-        'position': '',
-        'candidates': [],
-        'allowed_emails': [],
-        'is_configured': False
-    }
+    """Load configuration from JSON file (cached until the file changes on disk)"""
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {
+            'position': '',
+            'candidates': [],
+            'allowed_emails': [],
+            'is_configured': False
+        }
+
+    with _cache_lock:
+        if _config_cache['mtime'] == mtime:
+            return _config_cache['data']
+
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            config = _loads(f.read())
+    except FileNotFoundError:
+        # File removed between the stat and the open
+        return {
+            'position': '',
+            'candidates': [],
+            'allowed_emails': [],
+            'is_configured': False
+        }
+    # Migrate old format to new format if needed
+    if 'candidate_name' in config and 'candidates' not in config:
+        # Old format - convert to new
+        if config.get('candidate_name'):
+            config['candidates'] = [{'id': '1', 'name': config['candidate_name']}]
+        else:
+            config['candidates'] = []
+        del config['candidate_name']
+        # Persist the converted form so this branch never fires again
+        # (save_config also write-through-populates the cache)
+        save_config(config)
+        return config
+
+    with _cache_lock:
+        _config_cache['mtime'] = mtime
+        _config_cache['data'] = config
+    return config
 
 
 def save_config(data):
-    """Save configuration to JSON file"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save configuration to JSON file (write-to-temp + atomic rename)"""
+    mtime = _atomic_write_json(CONFIG_FILE, data)
+
+    # Write-through keyed on exactly the file written above (not a re-stat
+    # that could pick up a concurrent writer's replacement)
+    with _cache_lock:
+        _config_cache['mtime'] = mtime
+        _config_cache['data'] = data
 
 
 def load_roles():
-    """Load roles from JSON file"""
-    if os.path.exists(ROLES_FILE):
-        with open(ROLES_FILE, 'r') as f:
-            return json.load(f)
-    return {'roles': []}
+    """Load roles from JSON file (cached until the file changes on disk)"""
+    try:
+        mtime = os.stat(ROLES_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {'roles': []}
+
+    with _cache_lock:
+        if _roles_cache['mtime'] == mtime:
+            return _roles_cache['data']
+
+    try:
+        with open(ROLES_FILE, 'rb') as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        # File removed between the stat and the open
+        return {'roles': []}
+
+    with _cache_lock:
+        _roles_cache['mtime'] = mtime
+        _roles_cache['data'] = data
+        _roles_cache['by_id'] = {r['id']: r for r in data['roles']}
+    return data
 
 
 def save_roles(data):
-    """Save roles to JSON file"""
-    with open(ROLES_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save roles to JSON file (write-to-temp + atomic rename).
+
+    Serializes once and writes once instead of json.dump's many small
+    writes. Role dicts can carry in-memory derived caches (underscore
+    keys attached by the app layer), so those are stripped per role the
+    same way _atomic_write_json strips them at the top level.
+    """
+    payload = {
+        **data,
+        'roles': [
+            {k: v for k, v in role.items() if not k.startswith('_')}
+            for role in data.get('roles', [])
+        ]
+    }
+    mtime = _atomic_write_json(ROLES_FILE, payload)
+
+    # Write-through: cache exactly what was written, keyed on exactly the
+    # file it went into (not a re-stat that could pick up a concurrent
+    # writer's replacement)
+    with _cache_lock:
+        _roles_cache['mtime'] = mtime
+        _roles_cache['data'] = payload
+        _roles_cache['by_id'] = {r['id']: r for r in payload['roles']}
+
+
+def get_role_with_voted_ids(role_id):
+    """Fetch a role and the distinct voted candidate ids for it together"""
+    return get_role_by_id(role_id), distinct_voted_candidate_ids(role_id)
 
 
 def get_role_by_id(role_id):
-    """Get a specific role by ID"""
-    roles_data = load_roles()
-    for role in roles_data['roles']:
-        if role['id'] == role_id:
-            return role
-    return None
+    """Get a specific role by ID (O(1) via the cached id lookup table)"""
+    load_roles()  # ensure the cache reflects the file on disk
+    with _cache_lock:
+        by_id = _roles_cache['by_id']
+    if by_id is None:
+        # No roles file exists yet
+        return None
+    return by_id.get(role_id)
@@ -11,14 +11,15 @@ Requirements:
 """
 import os
 import sys
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, text
 
 
-def check_column_exists(engine, table_name, column_name):
-    """Check if a column exists in a table"""
-    inspector = inspect(engine)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
+def check_column_exists(conn, table_name, column_name):
+    """Check if a column exists in a table (one indexed catalog lookup)"""
+    return conn.execute(text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = :t AND column_name = :c"
+    ), {"t": table_name, "c": column_name}).first() is not None
 
 
 def migrate_database(verbose=True):
@@ -32,72 +33,70 @@ def migrate_database(verbose=True):
         True if migration succeeded or not needed, False if failed
     """
 
+    # All progress output funnels through log(), which is a no-op when
+    # quiet - no per-line verbose branches on the happy path
+    log = print if verbose else (lambda *args, **kwargs: None)
+
     database_url = os.getenv('DATABASE_URL')
 
     if not database_url:
-        if verbose:
-            print("✗ ERROR: DATABASE_URL environment variable is not set")
-            print("  This script is only needed for PostgreSQL databases.")
+        log("✗ ERROR: DATABASE_URL environment variable is not set")
+        log("  This script is only needed for PostgreSQL databases.")
         return False
 
-    if verbose:
-        print("=" * 70)
-        print("DATABASE MIGRATION: Add allow_results_override Column")
-        print("=" * 70)
-        print(f"Database: {database_url.split('@')[-1]}")  # Don't log credentials
+    log("=" * 70)
+    log("DATABASE MIGRATION: Add allow_results_override Column")
+    log("=" * 70)
+    log(f"Database: {database_url.split('@')[-1]}")  # Don't log credentials
 
     try:
         engine = create_engine(database_url)
 
-        with engine.connect() as conn:
-            if verbose:
-                print("✓ Connected to database successfully\n")
+        # One transaction for the whole migration: a single commit/fsync,
+        # and any failure rolls the DDL back atomically
+        with engine.begin() as conn:
+            log("✓ Connected to database successfully\n")
 
-            inspector = inspect(engine)
-            tables = inspector.get_table_names()
+            roles_table_exists = conn.execute(text(
+                "SELECT 1 FROM information_schema.tables WHERE table_name = 'roles'"
+            )).first() is not None
 
-            if 'roles' not in tables:
-                if verbose:
-                    print("✗ ERROR: 'roles' table does not exist in the database")
-                    print("  Run the application first to create tables.")
+            if not roles_table_exists:
+                log("✗ ERROR: 'roles' table does not exist in the database")
+                log("  Run the application first to create tables.")
                 return False
 
-            if verbose:
-                print("✓ Found 'roles' table")
+            log("✓ Found 'roles' table")
 
-            if check_column_exists(engine, 'roles', 'allow_results_override'):
-                if verbose:
-                    print("✓ Column 'allow_results_override' already exists")
-                    print("\nMigration not needed - database is already up to date!")
+            if check_column_exists(conn, 'roles', 'allow_results_override'):
+                log("✓ Column 'allow_results_override' already exists")
+                log("\nMigration not needed - database is already up to date!")
                 return True
 
-            if verbose:
-                print("⚠ Column 'allow_results_override' does NOT exist - migration needed\n")
+            log("⚠ Column 'allow_results_override' does NOT exist - migration needed\n")
 
-            if verbose:
-                print("\n[1/2] Adding 'allow_results_override' column...")
+            log("\n[1/2] Adding 'allow_results_override' column...")
 
+            # DEFAULT FALSE already populates existing rows via catalog
+            # metadata - no separate backfill UPDATE needed
             conn.execute(text("""
                 ALTER TABLE roles
                 ADD COLUMN allow_results_override BOOLEAN DEFAULT FALSE
             """))
-            conn.commit()
 
-            if verbose:
-                print("  ✓ Column added successfully")
+            log("  ✓ Column added successfully")
 
-            if verbose:
-                print("\n[2/2] Backfilling existing rows...")
+            log("\n[2/2] Verifying backfill...")
 
-            conn.execute(text("""
-                UPDATE roles
-                SET allow_results_override = FALSE
-                WHERE allow_results_override IS NULL
-            """))
-            conn.commit()
+            null_count = conn.execute(text(
+                "SELECT COUNT(*) FROM roles WHERE allow_results_override IS NULL"
+            )).scalar()
 
             if verbose:
-                print("  ✓ Existing rows updated")
+                if null_count == 0:
+                    print("  ✓ All rows carry the default")
+                else:
+                    print(f"  ⚠ Warning: {null_count} row(s) have NULL allow_results_override")
                 print("\n" + "=" * 70)
                 print("MIGRATION COMPLETED SUCCESSFULLY!")
                 print("=" * 70)
@@ -23,6 +23,20 @@ import json
 import shutil
 from datetime import datetime
 
+# orjson parses multi-MB vote files in one C pass; stdlib fallback keeps it
+# an optional dependency, same stance as the storage layer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json_file(path):
+    """One read syscall plus one parse of the whole file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 def main():
     """Main migration function"""
     print("="*60)
@@ -56,16 +70,27 @@ def main():
     print(f"✓ Found {roles_file}")
     print(f"✓ Found {votes_file}")
 
+    # Stream a large votes.json incrementally instead of materializing it,
+    # when ijson is available to do the incremental parse
+    try:
+        import ijson
+        stream_votes = os.path.getsize(votes_file) > 16 * 1024 * 1024
+    except ImportError:
+        ijson = None
+        stream_votes = False
+
     # Load JSON data
     print("\nReading JSON files...")
     try:
-        with open(roles_file, 'r') as f:
-            roles_data = json.load(f)
+        roles_data = _load_json_file(roles_file)
         print(f"  ✓ Loaded {len(roles_data.get('roles', []))} roles")
 
-        with open(votes_file, 'r') as f:
-            votes_data = json.load(f)
-        print(f"  ✓ Loaded {len(votes_data.get('votes', []))} votes")
+        if stream_votes:
+            votes_data = None
+            print(f"  ✓ {votes_file} is large - votes will be streamed during insert")
+        else:
+            votes_data = _load_json_file(votes_file)
+            print(f"  ✓ Loaded {len(votes_data.get('votes', []))} votes")
     except Exception as e:
         print(f"\n❌ ERROR reading JSON files: {e}")
         sys.exit(1)
@@ -74,7 +99,7 @@ def main():
     print("\nConnecting to PostgreSQL database...")
     try:
         from database import init_db
-        from db_operations import save_roles, save_votes, load_roles, load_votes
+        import db_operations  # noqa: F401 - fails fast if DATABASE_URL is unusable
         print("  ✓ Database modules loaded")
     except Exception as e:
         print(f"\n❌ ERROR loading database modules: {e}")
@@ -89,14 +114,24 @@ def main():
         print(f"\n❌ ERROR initializing database: {e}")
         sys.exit(1)
 
-    # Check if database already has data
-    existing_roles = load_roles()
-    existing_votes = load_votes()
-
-    if len(existing_roles.get('roles', [])) > 0 or len(existing_votes.get('votes', [])) > 0:
+    # Check if database already has data - EXISTS short-circuits without
+    # materializing a single row, and counts are fetched only for the warning
+    from sqlalchemy import text
+    from database import engine
+
+    with engine.connect() as conn:
+        has_data = conn.execute(text(
+            "SELECT EXISTS(SELECT 1 FROM roles) OR EXISTS(SELECT 1 FROM votes)"
+        )).scalar()
+        if has_data:
+            existing_role_count, existing_vote_count = conn.execute(text(
+                "SELECT (SELECT COUNT(*) FROM roles), (SELECT COUNT(*) FROM votes)"
+            )).one()
+
+    if has_data:
         print(f"\n⚠️  WARNING: Database already contains data:")
-        print(f"    - {len(existing_roles.get('roles', []))} roles")
-        print(f"    - {len(existing_votes.get('votes', []))} votes")
+        print(f"    - {existing_role_count} roles")
+        print(f"    - {existing_vote_count} votes")
 
         response = input("\nDo you want to REPLACE all existing data? (yes/no): ")
         if response.lower() != 'yes':
@@ -104,35 +139,110 @@ def main():
             sys.exit(0)
         print("  ✓ User confirmed data replacement")
 
-    # Migrate roles
-    print("\nMigrating roles to database...")
+    # Migrate everything in one transaction with bulk executemany inserts -
+    # one parameterized statement per table instead of a round-trip per row
+    print("\nMigrating roles and votes to database...")
     try:
-        save_roles(roles_data)
-        print(f"  ✓ Migrated {len(roles_data.get('roles', []))} roles")
+        import uuid
+
+        from database import engine
+        from models import Role, Candidate, AllowedVoter, Vote
+
+        role_rows = []
+        candidate_rows = []
+        voter_rows = []
+        for r in roles_data.get('roles', []):
+            role_id = uuid.UUID(r['id'])
+            role_rows.append({
+                'id': role_id,
+                'position': r['position'],
+                'hiring_manager': r.get('hiring_manager'),
+                'status': r.get('status', 'active'),
+                'allow_results_override': r.get('allow_results_override', False),
+                'created_at': datetime.fromisoformat(r['created_at']) if r.get('created_at') else datetime.utcnow(),
+                'updated_at': datetime.fromisoformat(r['updated_at']) if r.get('updated_at') else None
+            })
+            for c in r.get('candidates', []):
+                candidate_rows.append({
+                    'role_id': role_id,
+                    'candidate_id': c['id'],
+                    'name': c['name']
+                })
+            for email in r.get('allowed_emails', []):
+                voter_rows.append({'role_id': role_id, 'email': email.strip().lower()})
+
+        def vote_row(v):
+            return {
+                # Legacy JSON may hold mixed-case emails; the DB stores lowercase
+                'voter': v['voter'].strip().lower(),
+                'candidate_id': v['candidate_id'],
+                'candidate_name': v.get('candidate_name'),
+                'role_id': uuid.UUID(v['role_id']) if v.get('role_id') else None,
+                'role_position': v.get('role_position'),
+                'choice': v['choice'],
+                'feedback': v.get('feedback'),
+                'timestamp': datetime.fromisoformat(v['timestamp']) if v.get('timestamp') else datetime.utcnow()
+            }
+
+        def vote_row_stream():
+            """Yield vote rows one at a time; a large votes.json is parsed
+            incrementally with ijson so peak memory stays bounded by one
+            insert batch instead of the whole file"""
+            if stream_votes:
+                with open(votes_file, 'rb') as f:
+                    for v in ijson.items(f, 'votes.item'):
+                        yield vote_row(v)
+            else:
+                for v in votes_data.get('votes', []):
+                    yield vote_row(v)
+
+        vote_count = 0
+        with engine.begin() as conn:
+            # Replace semantics, child tables first for the foreign keys
+            conn.execute(Vote.__table__.delete())
+            conn.execute(AllowedVoter.__table__.delete())
+            conn.execute(Candidate.__table__.delete())
+            conn.execute(Role.__table__.delete())
+
+            if role_rows:
+                conn.execute(Role.__table__.insert(), role_rows)
+            if candidate_rows:
+                conn.execute(Candidate.__table__.insert(), candidate_rows)
+            if voter_rows:
+                conn.execute(AllowedVoter.__table__.insert(), voter_rows)
+
+            # Insert votes in bounded batches, overlapping parse with insert
+            batch = []
+            for row in vote_row_stream():
+                batch.append(row)
+                vote_count += 1
+                if len(batch) >= 1000:
+                    conn.execute(Vote.__table__.insert(), batch)
+                    batch.clear()
+            if batch:
+                conn.execute(Vote.__table__.insert(), batch)
+
+        print(f"  ✓ Migrated {len(role_rows)} roles")
+        print(f"  ✓ Migrated {vote_count} votes")
     except Exception as e:
-        print(f"\n❌ ERROR migrating roles: {e}")
-        sys.exit(1)
-
-    # Migrate votes
-    print("\nMigrating votes to database...")
-    try:
-        save_votes(votes_data)
-        print(f"  ✓ Migrated {len(votes_data.get('votes', []))} votes")
-    except Exception as e:
-        print(f"\n❌ ERROR migrating votes: {e}")
+        print(f"\n❌ ERROR migrating data: {e}")
         sys.exit(1)
 
     # Verify data integrity
     print("\nVerifying data integrity...")
     try:
-        db_roles = load_roles()
-        db_votes = load_votes()
+        # One combined round-trip for all three counts instead of reloading
+        # the full roles and votes tables just to len() them
+        with engine.connect() as conn:
+            db_role_count, db_vote_count, total_db_candidates = conn.execute(text(
+                """SELECT (SELECT COUNT(*) FROM roles),
+                          (SELECT COUNT(*) FROM votes),
+                          (SELECT COUNT(*) FROM candidates)"""
+            )).one()
 
         json_role_count = len(roles_data.get('roles', []))
-        db_role_count = len(db_roles.get('roles', []))
-
-        json_vote_count = len(votes_data.get('votes', []))
-        db_vote_count = len(db_votes.get('votes', []))
+        # When streaming, the parse-time row count stands in for len()
+        json_vote_count = vote_count if stream_votes else len(votes_data.get('votes', []))
 
         if json_role_count != db_role_count:
             print(f"  ❌ Role count mismatch: JSON={json_role_count}, DB={db_role_count}")
@@ -147,7 +257,6 @@ def main():
 
         # Verify candidate counts
         total_json_candidates = sum(len(r.get('candidates', [])) for r in roles_data.get('roles', []))
-        total_db_candidates = sum(len(r.get('candidates', [])) for r in db_roles.get('roles', []))
 
         if total_json_candidates != total_db_candidates:
             print(f"  ❌ Candidate count mismatch: JSON={total_json_candidates}, DB={total_db_candidates}")
@@ -166,11 +275,14 @@ def main():
         roles_backup = f'roles.json.backup_{timestamp}'
         votes_backup = f'votes.json.backup_{timestamp}'
 
-        shutil.copy2(roles_file, roles_backup)
-        print(f"  ✓ Created {roles_backup}")
-
-        shutil.copy2(votes_file, votes_backup)
-        print(f"  ✓ Created {votes_backup}")
+        # Hard-link when possible (same filesystem, zero bytes copied);
+        # copyfile falls back to the kernel's copy_file_range/sendfile path
+        for source, backup in ((roles_file, roles_backup), (votes_file, votes_backup)):
+            try:
+                os.link(source, backup)
+            except OSError:
+                shutil.copyfile(source, backup)
+            print(f"  ✓ Created {backup}")
     except Exception as e:
         print(f"\n⚠️  WARNING: Could not create backups: {e}")
         print("  (Migration was successful, but backups failed)")
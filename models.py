@@ -2,16 +2,44 @@
 SQLAlchemy ORM models for the blind voting system.
 Maps the JSON data structures to PostgreSQL tables.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, Integer, UniqueConstraint, CheckConstraint
+from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, Integer, Index, UniqueConstraint, CheckConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, validates
+import secrets
+import time
 import uuid
 from datetime import datetime
 
 Base = declarative_base()
 
 
+def uuid7():
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    Random uuid4 primary keys land in random B-tree pages, fragmenting the
+    index as the table grows; a millisecond-timestamp prefix keeps new keys
+    appending to the right edge. Stdlib uuid grows this in 3.14 - inline the
+    48-bit-timestamp + random-tail layout until then.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    return uuid.UUID(int=(
+        (ts_ms << 80)
+        | (0x7 << 76)
+        | ((rand >> 62) << 64)
+        | (0x2 << 62)
+        | (rand & ((1 << 62) - 1))
+    ))
+
+# Serialized-role cache. to_dict rebuilds the nested dict and re-formats
+# timestamps on every call, but a role only changes when updated_at moves -
+# key the finished dict on (id, updated_at) and hand out shallow copies.
+# Shallow is enough: callers replace top-level keys, never mutate the
+# nested lists in place.
+_role_dict_cache = {}
+
+
 class Role(Base):
     """
     Represents a voting role/position.
@@ -19,32 +47,46 @@ class Role(Base):
     """
     __tablename__ = 'roles'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     position = Column(String(255), nullable=False)
     hiring_manager = Column(String(255), nullable=True)  # Email of hiring manager (nullable for migration)
     status = Column(String(50), default='active')  # active, fulfilled, expired
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # server_default lets DB-side paths (COPY, raw INSERT) omit the column;
+    # the Python default still applies for ORM inserts
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
+    # func.now() renders into the UPDATE itself - no Python datetime
+    # allocation or extra bind param per update, and direct SQL that uses
+    # the ORM still gets a server-consistent clock
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), onupdate=func.now())
     allow_results_override = Column(Boolean, default=False, nullable=False)
 
-    # Relationships
-    candidates = relationship('Candidate', back_populates='role', cascade='all, delete-orphan')
-    allowed_voters = relationship('AllowedVoter', back_populates='role', cascade='all, delete-orphan')
+    # Relationships. candidates and allowed_voters load with selectin -
+    # to_dict always walks both, and the default lazy='select' turned any
+    # list of roles into an N+1 query pattern. votes stays lazy: it is
+    # rarely traversed and can be large.
+    candidates = relationship('Candidate', back_populates='role', cascade='all, delete-orphan', lazy='selectin')
+    allowed_voters = relationship('AllowedVoter', back_populates='role', cascade='all, delete-orphan', lazy='selectin')
     votes = relationship('Vote', back_populates='role')
 
     def to_dict(self):
         """Convert to JSON-compatible dictionary"""
-        return {
-            'id': str(self.id),
-            'position': self.position,
-            'hiring_manager': self.hiring_manager,
-            'candidates': [c.to_dict() for c in self.candidates],
-            'allowed_emails': [v.email for v in self.allowed_voters],
-            'status': self.status,
-            'allow_results_override': self.allow_results_override,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        key = (str(self.id), self.updated_at)
+        cached = _role_dict_cache.get(key)
+        if cached is None:
+            if len(_role_dict_cache) > 256:
+                _role_dict_cache.clear()
+            cached = _role_dict_cache[key] = {
+                'id': key[0],
+                'position': self.position,
+                'hiring_manager': self.hiring_manager,
+                'candidates': [c.to_dict() for c in self.candidates],
+                'allowed_emails': [v.email for v in self.allowed_voters],
+                'status': self.status,
+                'allow_results_override': self.allow_results_override,
+                'created_at': self.created_at.isoformat() if self.created_at else None,
+                'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            }
+        return {**cached}
 
 
 class Candidate(Base):
@@ -92,6 +134,12 @@ class AllowedVoter(Base):
         UniqueConstraint('role_id', 'email', name='uq_role_email'),
     )
 
+    @validates('email')
+    def _normalize_email(self, key, value):
+        # Lowercase at write time so membership checks and the uniqueness
+        # constraint are case-insensitive without LOWER() at query time
+        return value.strip().lower() if value else value
+
 
 class Vote(Base):
     """
@@ -107,14 +155,34 @@ class Vote(Base):
     role_id = Column(UUID(as_uuid=True), ForeignKey('roles.id', ondelete='RESTRICT'), nullable=False)
     role_position = Column(String(255))  # denormalized for performance
     choice = Column(String(50), nullable=False)  # "Inclined" or "Not Inclined"
-    feedback = Column(Text)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Deferred: feedback is the widest column and the only TEXT one, and the
+    # hot query paths (tallies, counts, the column-projected load_votes) never
+    # read it through the ORM. Entity loads fetch it on first attribute access.
+    feedback = deferred(Column(Text))
+    timestamp = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     # Relationship
     role = relationship('Role', back_populates='votes')
 
+    @validates('voter')
+    def _normalize_voter(self, key, value):
+        # Same write-side normalization as AllowedVoter.email: comparisons
+        # against voter stay plain equality on the indexed column
+        return value.strip().lower() if value else value
+
     __table_args__ = (
         UniqueConstraint('voter', 'candidate_id', 'role_id', name='uq_voter_candidate_role'),
+        # Per-role lookups (counts, EXISTS checks, tallies) filter on role_id.
+        # The composite index leads the tallies' filter/group columns and
+        # carries choice as an INCLUDE payload so the aggregate runs as an
+        # index-only scan with no heap touch; (role_id, voter) serves the
+        # voter-has-voted checks without reaching through the voter-leading
+        # unique constraint. create_all adds these for new databases;
+        # existing ones need a manual CREATE INDEX CONCURRENTLY.
+        Index('ix_votes_role_id', 'role_id'),
+        Index('ix_votes_role_candidate', 'role_id', 'candidate_id',
+              postgresql_include=['choice']),
+        Index('ix_votes_role_voter', 'role_id', 'voter'),
     )
 
     def to_dict(self):
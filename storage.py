@@ -19,28 +19,50 @@ if USE_DATABASE:
     from db_operations import (
         load_votes,
         save_votes,
+        bulk_save_votes,
+        bulk_upsert_votes,
         load_config,
         save_config,
         load_roles,
         save_roles,
         get_role_by_id,
+        get_role_with_voted_ids,
         save_role,
         save_vote,
-        delete_role
+        delete_role,
+        aggregate_votes,
+        count_votes,
+        distinct_voted_candidate_ids,
+        vote_counts_by_role,
+        role_has_votes
     )
     # Also export database initialization function
     from database import init_db
+
+    def data_version():
+        """No cheap change token for the database backend - callers skip
+        response caching when this returns None"""
+        return None
 else:
     print("Using JSON files for storage")
     # Import all functions from json_operations
     from json_operations import (
         load_votes,
         save_votes,
+        bulk_save_votes,
+        append_vote,
         load_config,
         save_config,
         load_roles,
         save_roles,
-        get_role_by_id
+        get_role_by_id,
+        get_role_with_voted_ids,
+        data_version,
+        aggregate_votes,
+        count_votes,
+        distinct_voted_candidate_ids,
+        vote_counts_by_role,
+        role_has_votes
     )
 
     # JSON doesn't have these functions, so create dummy implementations
@@ -61,20 +83,12 @@ else:
         return role_data
 
     def save_vote(vote_data):
-        """Save a single vote - JSON version updates the entire votes file"""
-        votes_data = load_votes()
-        # Find and update or append
-        found = False
-        for i, vote in enumerate(votes_data['votes']):
-            if (vote['voter'].lower() == vote_data['voter'].lower() and
-                vote['candidate_id'] == vote_data['candidate_id'] and
-                vote.get('role_id') == vote_data.get('role_id')):
-                votes_data['votes'][i] = vote_data
-                found = True
-                break
-        if not found:
-            votes_data['votes'].append(vote_data)
-        save_votes(votes_data)
+        """Save a single vote - JSON version appends to the votes log"""
+        append_vote(vote_data)
+
+    # The JSON log replays with last-write-wins semantics, so a bulk append
+    # already behaves as an upsert
+    bulk_upsert_votes = bulk_save_votes
 
     def delete_role(role_id):
         """Delete a role - JSON version"""
@@ -94,6 +108,8 @@ __all__ = [
     'USE_DATABASE',
     'load_votes',
     'save_votes',
+    'bulk_save_votes',
+    'bulk_upsert_votes',
     'save_vote',
     'load_config',
     'save_config',
@@ -101,6 +117,13 @@ __all__ = [
     'save_roles',
     'save_role',
     'get_role_by_id',
+    'get_role_with_voted_ids',
     'delete_role',
-    'init_db'
+    'init_db',
+    'data_version',
+    'aggregate_votes',
+    'count_votes',
+    'distinct_voted_candidate_ids',
+    'vote_counts_by_role',
+    'role_has_votes'
 ]
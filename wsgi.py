@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production servers.
+
+Run with:
+    gunicorn -c gunicorn_config.py wsgi:app
+"""
+from app import app
+
+if __name__ == '__main__':
+    app.run()